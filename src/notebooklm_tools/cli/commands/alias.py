@@ -5,6 +5,7 @@ from rich.console import Console
 from rich.table import Table
 
 from notebooklm_tools.core.alias import get_alias_manager, detect_id_type
+from notebooklm_tools.cli.utils import confirm_action
 
 console = Console()
 app = typer.Typer(
@@ -90,8 +91,7 @@ def delete_alias(
     confirm: bool = typer.Option(False, "--confirm", "-y", help="Skip confirmation"),
 ) -> None:
     """Delete an alias."""
-    if not confirm:
-        typer.confirm(f"Are you sure you want to delete alias '{name}'?", abort=True)
+    confirm_action(f"Are you sure you want to delete alias '{name}'?", confirm)
         
     manager = get_alias_manager()
     if manager.delete_alias(name):
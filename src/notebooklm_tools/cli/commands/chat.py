@@ -5,9 +5,10 @@ from typing import Optional
 import typer
 from rich.console import Console
 
+from notebooklm_tools.core import constants
 from notebooklm_tools.core.alias import get_alias_manager
 from notebooklm_tools.core.exceptions import NLMError
-from notebooklm_tools.cli.utils import get_client
+from notebooklm_tools.cli.utils import code_choice, get_client
 from notebooklm_tools.services import chat as chat_service, ServiceError
 
 console = Console()
@@ -23,6 +24,7 @@ def configure_chat(
     notebook_id: str = typer.Argument(..., help="Notebook ID"),
     goal: str = typer.Option(
         "default", "--goal", "-g",
+        callback=code_choice(constants.CHAT_GOALS),
         help="Chat goal: default, learning_guide, or custom",
     ),
     prompt: Optional[str] = typer.Option(
@@ -31,6 +33,7 @@ def configure_chat(
     ),
     response_length: str = typer.Option(
         "default", "--response-length", "-r",
+        callback=code_choice(constants.CHAT_RESPONSE_LENGTHS),
         help="Response length: default, longer, or shorter",
     ),
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
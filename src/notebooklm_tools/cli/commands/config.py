@@ -4,6 +4,7 @@ import typer
 from rich.console import Console
 from rich.syntax import Syntax
 
+from notebooklm_tools.utils import json_utils
 from notebooklm_tools.utils.config import get_config, save_config, _config_to_toml
 
 console = Console()
@@ -22,8 +23,7 @@ def show_config(
     config = get_config()
     
     if json_output:
-        import json
-        console.print_json(json.dumps(config.model_dump(), indent=2))
+        print(json_utils.dumps(config.model_dump()))
     else:
         # Print as TOML syntax highlighted
         toml_str = _config_to_toml(config)
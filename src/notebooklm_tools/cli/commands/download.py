@@ -15,7 +15,11 @@ from rich.progress import (
 from notebooklm_tools.core.client import ArtifactNotReadyError
 from notebooklm_tools.cli.utils import get_client, handle_error
 from notebooklm_tools.core.alias import get_alias_manager
-from notebooklm_tools.services import downloads as downloads_service, ServiceError
+from notebooklm_tools.services import (
+    downloads as downloads_service,
+    studio as studio_service,
+    ServiceError,
+)
 
 app = typer.Typer(help="Download artifacts from notebooks.")
 console = Console()
@@ -259,3 +263,40 @@ def download_flashcards_cmd(
 ):
     """Download Flashcards."""
     _interactive_download(notebook_id, "flashcards", output, artifact_id, format)
+
+
+# --- Everything at once ---
+
+@app.command("all")
+def download_all(
+    notebook_id: str = typer.Argument(..., help="Notebook ID"),
+    output_dir: str = typer.Option(".", "--output-dir", "-o", help="Directory to save into"),
+):
+    """Download every completed artifact in a notebook."""
+    notebook_id = get_alias_manager().resolve(notebook_id)
+    client = get_client()
+
+    try:
+        with console.status("Downloading artifacts..."):
+            status = studio_service.get_studio_status(client, notebook_id)
+            ready = [
+                a for a in status["artifacts"]
+                if a.get("status") == "completed"
+                and a.get("type") in downloads_service.VALID_ARTIFACT_TYPES
+            ]
+            result = downloads_service.download_artifacts(client, notebook_id, ready, output_dir)
+    except ServiceError as e:
+        err_console.print(f"[red]Error:[/red] {e.user_message}")
+        raise typer.Exit(1) from None
+    except Exception as e:
+        handle_error(e)
+
+    if not ready:
+        console.print("[dim]No completed artifacts to download.[/dim]")
+        return
+    for item in result["downloaded"]:
+        console.print(f"[green]✓[/green] Downloaded {item['artifact_type'].replace('_', ' ')} to: {item['path']}")
+    for artifact_id, message in result["failed"].items():
+        err_console.print(f"[red]✗[/red] {artifact_id}: {message}")
+    if result["failed"]:
+        raise typer.Exit(1)
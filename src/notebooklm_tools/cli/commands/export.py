@@ -9,6 +9,7 @@ from notebooklm_tools.core.alias import get_alias_manager
 from notebooklm_tools.core.exceptions import NLMError
 from notebooklm_tools.cli.utils import get_client
 from notebooklm_tools.services import exports as export_service, ServiceError
+from notebooklm_tools.utils import json_utils
 
 console = Console()
 app = typer.Typer(
@@ -51,8 +52,7 @@ def export_artifact(
             )
         
         if json_output:
-            import json
-            console.print(json.dumps(result, indent=2))
+            console.print(json_utils.dumps(result))
             return
         
         console.print(f"[green]✓[/green] {result['message']}")
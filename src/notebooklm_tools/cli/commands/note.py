@@ -8,8 +8,9 @@ from rich.table import Table
 
 from notebooklm_tools.core.alias import get_alias_manager
 from notebooklm_tools.core.exceptions import NLMError
-from notebooklm_tools.cli.utils import get_client
+from notebooklm_tools.cli.utils import confirm_action, get_client
 from notebooklm_tools.services import notes as notes_service, ServiceError
+from notebooklm_tools.utils import json_utils
 
 console = Console()
 app = typer.Typer(
@@ -38,8 +39,7 @@ def list_notes(
             for note in notes:
                 console.print(note['id'])
         elif json_output:
-            import json
-            console.print(json.dumps(result, indent=2))
+            console.print(json_utils.dumps(result))
         else:
             if not notes:
                 console.print(f"[dim]No notes found in notebook {notebook_id}[/dim]")
@@ -130,11 +130,7 @@ def delete_note(
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
 ) -> None:
     """Delete a note permanently."""
-    if not confirm:
-        confirmed = typer.confirm(f"Delete note {note_id}? This action is IRREVERSIBLE.")
-        if not confirmed:
-            console.print("[dim]Cancelled[/dim]")
-            raise typer.Exit(0)
+    confirm_action(f"Delete note {note_id}? This action is IRREVERSIBLE.", confirm)
 
     try:
         notebook_id = get_alias_manager().resolve(notebook_id)
@@ -8,7 +8,7 @@ from rich.console import Console
 from notebooklm_tools.core.alias import get_alias_manager
 from notebooklm_tools.core.exceptions import NLMError
 from notebooklm_tools.cli.formatters import detect_output_format, get_formatter
-from notebooklm_tools.cli.utils import get_client
+from notebooklm_tools.cli.utils import confirm_action, get_client, parse_source_ids
 from notebooklm_tools.services import (
     notebooks as notebooks_service,
     chat as chat_service,
@@ -153,11 +153,7 @@ def delete_notebook(
     """Delete a notebook permanently."""
     notebook_id = get_alias_manager().resolve(notebook_id)
     
-    if not confirm:
-        typer.confirm(
-            f"Are you sure you want to delete notebook {notebook_id}?",
-            abort=True,
-        )
+    confirm_action(f"Are you sure you want to delete notebook {notebook_id}?", confirm)
     
     try:
         with get_client(profile) as client:
@@ -191,7 +187,7 @@ def query_notebook(
 ) -> None:
     """Chat with notebook sources."""
     try:
-        sources = source_ids.split(",") if source_ids else None
+        sources = parse_source_ids(source_ids)
         notebook_id = get_alias_manager().resolve(notebook_id)
         
         with get_client(profile) as client:
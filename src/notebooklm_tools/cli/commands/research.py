@@ -1,17 +1,27 @@
 """Research CLI commands."""
 
+import time
 from typing import Optional
 
 import typer
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from notebooklm_tools.core import constants
 from notebooklm_tools.core.alias import get_alias_manager
+from notebooklm_tools.core.client import NotebookLMClient
 from notebooklm_tools.core.exceptions import NLMError
-from notebooklm_tools.cli.utils import get_client
+from notebooklm_tools.cli.utils import code_choice, get_client
 from notebooklm_tools.services import research as research_service, ServiceError
 
 console = Console()
+
+# Upper bound for the status poll interval while a research task is unchanged
+MAX_POLL_INTERVAL = 60.0
+
+# Starting poll interval for 'research start --wait', by research mode
+WAIT_POLL_INTERVALS = {"fast": 5, "deep": 30}
+
 app = typer.Typer(
     help="Research and discover sources",
     rich_markup_mode="rich",
@@ -24,10 +34,12 @@ def start_research(
     query: str = typer.Argument(..., help="What to search for"),
     source: str = typer.Option(
         "web", "--source", "-s",
+        callback=code_choice(constants.RESEARCH_SOURCES),
         help="Where to search: web or drive",
     ),
     mode: str = typer.Option(
         "fast", "--mode", "-m",
+        callback=code_choice(constants.RESEARCH_MODES),
         help="Research mode: fast (~30s, ~10 sources) or deep (~5min, ~40 sources, web only)",
     ),
     notebook_id: Optional[str] = typer.Option(
@@ -42,6 +54,18 @@ def start_research(
         False, "--force", "-f",
         help="Start new research even if one is already pending",
     ),
+    wait: bool = typer.Option(
+        False, "--wait", "-w",
+        help="Wait for the research to finish and show the results",
+    ),
+    import_all: bool = typer.Option(
+        False, "--import",
+        help="Wait, then import every discovered source (implies --wait)",
+    ),
+    max_wait: int = typer.Option(
+        900, "--max-wait",
+        help="Maximum seconds to wait with --wait/--import",
+    ),
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
 ) -> None:
     """
@@ -49,7 +73,8 @@ def start_research(
     
     This searches the web or Google Drive to discover relevant sources
     for your research topic. Use 'nlm research status' to check progress
-    and 'nlm research import' to add discovered sources to your notebook.
+    and 'nlm research import' to add discovered sources to your notebook,
+    or pass --wait / --import to do it all in one command.
     """
     try:
         if not notebook_id:
@@ -82,16 +107,36 @@ def start_research(
                 source=source, mode=mode,
             )
         
-        console.print("[green]✓[/green] Research started")
-        console.print(f"  Query: {query}")
-        console.print(f"  Source: {source}")
-        console.print(f"  Mode: {mode}")
-        console.print(f"  Notebook ID: {notebook_id}")
-        console.print(f"  Task ID: {result['task_id']}")
-        
-        estimate = "~30 seconds" if mode == "fast" else "~5 minutes"
-        console.print(f"\n[dim]Estimated time: {estimate}[/dim]")
-        console.print(f"[dim]Run 'nlm research status {notebook_id}' to check progress.[/dim]")
+            console.print("[green]✓[/green] Research started")
+            console.print(f"  Query: {query}")
+            console.print(f"  Source: {source}")
+            console.print(f"  Mode: {mode}")
+            console.print(f"  Notebook ID: {notebook_id}")
+            console.print(f"  Task ID: {result['task_id']}")
+
+            estimate = "~30 seconds" if mode == "fast" else "~5 minutes"
+            console.print(f"\n[dim]Estimated time: {estimate}[/dim]")
+            if not (wait or import_all):
+                console.print(f"[dim]Run 'nlm research status {notebook_id}' to check progress.[/dim]")
+                return
+
+            # Reuse this client for the follow-up polls and the import
+            task_id = result["task_id"]
+            status = _wait_for_research(
+                client, notebook_id, task_id,
+                compact=True,
+                poll_interval=WAIT_POLL_INTERVALS[mode.lower()],
+                max_wait=max_wait,
+            )
+            if not import_all or status["status"] != "completed":
+                _display_research_status(status, compact=True)
+                if import_all:
+                    console.print("[yellow]Warning:[/yellow] Research did not finish in time; nothing imported.")
+                    raise typer.Exit(1)
+                return
+
+            imported = research_service.import_research(client, notebook_id, task_id)
+        _print_imported(imported)
     except ServiceError as e:
         console.print(f"[red]Error:[/red] {e.user_message}")
         raise typer.Exit(1)
@@ -112,7 +157,7 @@ def check_status(
     ),
     poll_interval: int = typer.Option(
         30, "--poll-interval",
-        help="Seconds between status checks",
+        help="Seconds between status checks (backs off while unchanged)",
     ),
     max_wait: int = typer.Option(
         300, "--max-wait",
@@ -131,35 +176,13 @@ def check_status(
         if task_id:
             task_id = get_alias_manager().resolve(task_id)
 
-        # Polling loop is a CLI-only presentation concern (progress spinners)
-        if max_wait > 0:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                progress.add_task("Waiting for research to complete...", total=None)
-                
-                import time
-                elapsed = 0
-                with get_client(profile) as client:
-                    while elapsed < max_wait:
-                        result = research_service.poll_research(
-                            client, notebook_id,
-                            task_id=task_id,
-                            compact=compact,
-                        )
-                        if result["status"] == "completed":
-                            break
-                        time.sleep(poll_interval)
-                        elapsed += poll_interval
-        else:
-            with get_client(profile) as client:
-                result = research_service.poll_research(
-                    client, notebook_id,
-                    task_id=task_id,
-                    compact=compact,
-                )
+        with get_client(profile) as client:
+            result = _wait_for_research(
+                client, notebook_id, task_id,
+                compact=compact,
+                poll_interval=poll_interval,
+                max_wait=max_wait,
+            )
         
         _display_research_status(result, compact)
 
@@ -173,6 +196,54 @@ def check_status(
         raise typer.Exit(1)
 
 
+def _wait_for_research(
+    client: NotebookLMClient,
+    notebook_id: str,
+    task_id: Optional[str],
+    compact: bool,
+    poll_interval: float,
+    max_wait: float,
+) -> dict:
+    """Poll until the research completes or max_wait runs out (0 = one check)."""
+    if max_wait <= 0:
+        return research_service.poll_research(
+            client, notebook_id, task_id=task_id, compact=compact,
+        )
+
+    # Polling loop is a CLI-only presentation concern (progress spinners)
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    ) as progress:
+        progress.add_task("Waiting for research to complete...", total=None)
+
+        deadline = time.monotonic() + max_wait
+        interval = float(poll_interval)
+        last_state = None
+        while True:
+            result = research_service.poll_research(
+                client, notebook_id, task_id=task_id, compact=compact,
+            )
+            remaining = deadline - time.monotonic()
+            if result["status"] == "completed" or remaining <= 0:
+                return result
+            state = (result["status"], len(result.get("sources", [])))
+            interval = _next_poll_interval(
+                interval, poll_interval, changed=state != last_state,
+            )
+            last_state = state
+            # Never sleep past the deadline; poll once more at it
+            time.sleep(min(interval, remaining))
+
+
+def _next_poll_interval(current: float, base: float, changed: bool) -> float:
+    """Back off by 1.5x while the task looks unchanged; reset on progress."""
+    if changed:
+        return float(base)
+    return max(float(base), min(current * 1.5, MAX_POLL_INTERVAL))
+
+
 def _display_research_status(result: dict, compact: bool) -> None:
     """Display research status in a formatted way (presentation-only helper)."""
     status = result["status"]
@@ -227,6 +298,16 @@ def _display_research_status(result: dict, compact: bool) -> None:
         console.print(f"\n[dim]Run 'nlm research import {nb_id} <task-id>' to import sources.[/dim]")
 
 
+def _print_imported(result: dict) -> None:
+    """Print the outcome of a research import."""
+    console.print(f"[green]✓[/green] {result['message']}")
+    for src in result.get("imported_sources", []):
+        if isinstance(src, dict):
+            console.print(f"  • {src.get('title', 'Unknown')}")
+        else:
+            console.print(f"  • {getattr(src, 'title', 'Unknown')}")
+
+
 @app.command("import")
 def import_research(
     notebook_id: str = typer.Argument(..., help="Notebook ID"),
@@ -278,12 +359,7 @@ def import_research(
                 source_indices=source_indices,
             )
         
-        console.print(f"[green]✓[/green] {result['message']}")
-        for src in result.get("imported_sources", []):
-            if isinstance(src, dict):
-                console.print(f"  • {src.get('title', 'Unknown')}")
-            else:
-                console.print(f"  • {getattr(src, 'title', 'Unknown')}")
+        _print_imported(result)
     except ValueError:
         console.print("[red]Error:[/red] Invalid indices. Use comma-separated numbers like: 0,2,5")
         raise typer.Exit(1)
@@ -10,6 +10,7 @@ from notebooklm_tools.core.alias import get_alias_manager
 from notebooklm_tools.core.exceptions import NLMError
 from notebooklm_tools.cli.utils import get_client
 from notebooklm_tools.services import sharing as sharing_service, ServiceError
+from notebooklm_tools.utils import json_utils
 
 console = Console()
 app = typer.Typer(
@@ -32,8 +33,7 @@ def share_status(
             result = sharing_service.get_share_status(client, notebook_id)
         
         if json_output:
-            import json
-            console.print(json.dumps(result, indent=2))
+            console.print(json_utils.dumps(result))
             return
         
         # Rich output
@@ -1,5 +1,6 @@
 """Source CLI commands."""
 
+from pathlib import Path
 from typing import Optional
 
 import typer
@@ -8,7 +9,7 @@ from rich.console import Console
 from notebooklm_tools.core.alias import get_alias_manager
 from notebooklm_tools.core.exceptions import NLMError
 from notebooklm_tools.cli.formatters import detect_output_format, get_formatter
-from notebooklm_tools.cli.utils import get_client
+from notebooklm_tools.cli.utils import cli_error_boundary, confirm_action, get_client, name_choice, parse_source_ids
 from notebooklm_tools.services import sources as sources_service, ServiceError
 
 console = Console()
@@ -37,8 +38,11 @@ def list_sources(
             if drive:
                 sources = client.get_notebook_sources_with_types(notebook_id)
                 if not skip_freshness:
+                    freshness = sources_service.check_sources_freshness(
+                        client, [src['id'] for src in sources],
+                    )
                     for src in sources:
-                        src['is_fresh'] = client.check_source_freshness(src['id'])
+                        src['is_fresh'] = freshness[src['id']]
             else:
                 sources = client.get_notebook_sources_with_types(notebook_id)
 
@@ -61,7 +65,7 @@ def add_source(
     youtube: Optional[str] = typer.Option(None, "--youtube", "-y", help="YouTube URL"),
     file: Optional[str] = typer.Option(None, "--file", "-f", help="Local file to upload (PDF, etc.)"),
     title: str = typer.Option("", "--title", help="Title for the source"),
-    doc_type: str = typer.Option("doc", "--type", help="Drive doc type: doc, slides, sheets, pdf"),
+    doc_type: str = typer.Option("doc", "--type", callback=name_choice(sources_service.VALID_DRIVE_DOC_TYPES), help="Drive doc type: doc, slides, sheets, pdf"),
     wait: bool = typer.Option(False, "--wait", "-w", help="Wait for source processing to complete"),
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
 ) -> None:
@@ -144,6 +148,59 @@ def add_source(
         raise typer.Exit(1)
 
 
+def _read_batch_file(path: Optional[Path]) -> list[str]:
+    """Read one entry per line, skipping blanks and '#' comments."""
+    if path is None:
+        return []
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except OSError as e:
+        console.print(f"[red]Error:[/red] Could not read {path}: {e}")
+        raise typer.Exit(1)
+    return [line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#")]
+
+
+@app.command("add-batch")
+@cli_error_boundary
+def add_sources_batch(
+    notebook_id: str = typer.Argument(..., help="Notebook ID"),
+    urls_file: Optional[Path] = typer.Option(
+        None, "--urls-file", help="File with one URL per line", exists=True, dir_okay=False,
+    ),
+    drive_ids_file: Optional[Path] = typer.Option(
+        None, "--drive-ids-file", help="File with one Drive document ID per line",
+        exists=True, dir_okay=False,
+    ),
+    doc_type: str = typer.Option("doc", "--type", callback=name_choice(sources_service.VALID_DRIVE_DOC_TYPES), help="Drive doc type: doc, slides, sheets, pdf"),
+    profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
+) -> None:
+    """Add many URL and Drive sources in a single request.
+
+    Examples:
+        nlm source add-batch <notebook-id> --urls-file urls.txt
+        nlm source add-batch <notebook-id> --drive-ids-file ids.txt --type slides
+    """
+    urls = _read_batch_file(urls_file)
+    document_ids = _read_batch_file(drive_ids_file)
+    if not urls and not document_ids:
+        console.print("[red]Error:[/red] Please provide --urls-file and/or --drive-ids-file with at least one entry")
+        raise typer.Exit(1)
+
+    notebook_id = get_alias_manager().resolve(notebook_id)
+    total = len(urls) + len(document_ids)
+    with console.status(f"Adding {total} sources..."), get_client(profile) as client:
+        results = sources_service.add_sources_batch(
+            client, notebook_id,
+            urls=urls, document_ids=document_ids, doc_type=doc_type,
+        )
+
+    for result in results:
+        console.print(f"[green]✓[/green] {result['title']} [dim]({result['source_id']})[/dim]")
+    if len(results) < total:
+        console.print(f"[yellow]Warning:[/yellow] Added {len(results)} of {total} sources")
+        raise typer.Exit(1)
+
+
 @app.command("get")
 def get_source(
     source_id: str = typer.Argument(..., help="Source ID"),
@@ -203,7 +260,7 @@ def get_source_content(
 
         if output:
             from pathlib import Path
-            Path(output).write_text(content["content"])
+            Path(output).write_text(content["content"], encoding="utf-8")
             console.print(f"[green]✓[/green] Wrote {content['char_count']:,} characters to {output}")
         else:
             fmt = detect_output_format(json_output)
@@ -225,11 +282,7 @@ def delete_source(
     """Delete a source permanently."""
     source_id = get_alias_manager().resolve(source_id)
 
-    if not confirm:
-        typer.confirm(
-            f"Are you sure you want to delete source {source_id}?",
-            abort=True,
-        )
+    confirm_action(f"Are you sure you want to delete source {source_id}?", confirm)
 
     try:
         with get_client(profile) as client:
@@ -293,7 +346,7 @@ def sync_sources(
 
         with get_client(profile) as client:
             if source_ids:
-                ids_to_sync = [get_alias_manager().resolve(sid.strip()) for sid in source_ids.split(",")]
+                ids_to_sync = parse_source_ids(source_ids)
             else:
                 sources = client.get_notebook_sources_with_types(notebook_id)
                 ids_to_sync = [s['id'] for s in sources if not s.get('is_fresh', True)]
@@ -302,11 +355,7 @@ def sync_sources(
             console.print("[green]✓[/green] No sources need syncing.")
             return
 
-        if not confirm:
-            typer.confirm(
-                f"Sync {len(ids_to_sync)} source(s)?",
-                abort=True,
-            )
+        confirm_action(f"Sync {len(ids_to_sync)} source(s)?", confirm)
 
         with get_client(profile) as client:
             results = sources_service.sync_drive_sources(client, ids_to_sync)
@@ -1,19 +1,39 @@
 """Studio CLI commands for generation (audio, report, quiz, etc.)."""
 
+import json
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
 from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.text import Text
 
+from notebooklm_tools.core import constants
 from notebooklm_tools.core.alias import get_alias_manager
-from notebooklm_tools.core.exceptions import NLMError
 from notebooklm_tools.cli.formatters import detect_output_format, get_formatter
-from notebooklm_tools.cli.utils import get_client
+from notebooklm_tools.cli.utils import (
+    cli_error_boundary,
+    code_choice,
+    confirm_action,
+    get_client,
+    parse_source_ids,
+)
 from notebooklm_tools.services import studio as studio_service, ServiceError, ValidationError
 
 console = Console()
 
+# Creation calls can block for a long time; a slow, steady spinner is
+# enough feedback and keeps terminal redraws down
+SPINNER_REFRESH_PER_SECOND = 4
+
+# Status prefixes parsed once; the text after them is printed without markup
+# parsing (per-item lines in batch delete/create, API-provided titles)
+_OK = Text.from_markup("[green]✓[/green]")
+_ERR = Text.from_markup("[red]Error:[/red]")
+
+
 # Main studio app for status/delete
 app = typer.Typer(
     help="Manage studio artifacts",
@@ -69,63 +89,67 @@ data_table_app = typer.Typer(
 )
 
 
-def parse_source_ids(source_ids: str | None) -> list[str] | None:
-    """Parse comma-separated source IDs."""
-    if source_ids:
-        return [get_alias_manager().resolve(s.strip()) for s in source_ids.split(",")]
-    return None
+@contextmanager
+def _spinner(message: str) -> Iterator[None]:
+    """Show a transient spinner with a message while the block runs."""
+    with console.status(
+        message,
+        spinner="dots",
+        speed=0.5,
+        refresh_per_second=SPINNER_REFRESH_PER_SECOND,
+    ):
+        yield
+
+
+def _print_started(label: str, artifact_id: str, notebook_id: str) -> None:
+    """Print the 'generation started' epilogue in a single write."""
+    console.print(
+        f"[green]✓[/green] {label.title()} generation started\n"
+        f"  Artifact ID: {artifact_id}\n"
+        f"\n[dim]Run 'nlm studio status {notebook_id}' to check progress.[/dim]"
+    )
 
 
+@cli_error_boundary
 def _run_create(
     notebook_id: str,
     artifact_type: str,
     label: str,
     profile: Optional[str],
+    confirm: bool,
+    prompt: str,
     **kwargs,
 ) -> None:
-    """Shared CLI creation logic: spinner + service call + formatted output.
+    """Shared CLI creation logic: confirm + spinner + service call + formatted output.
 
-    CLI-specific concerns (confirmation, arg parsing) happen in each command.
-    This helper handles the common pattern of spinner → create → print result.
+    Each command only declares its Typer options and maps them to service
+    kwargs; this helper handles validate → confirm → spinner → create →
+    print result. Validation runs first so bad options fail before prompting
+    or opening a client.
     """
-    try:
-        notebook_id = get_alias_manager().resolve(notebook_id)
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            progress.add_task(f"Creating {label}...", total=None)
-            with get_client(profile) as client:
-                result = studio_service.create_artifact(
-                    client, notebook_id, artifact_type, **kwargs,
-                )
-
-        # Mind map has a different result shape
-        if artifact_type == "mind_map":
-            console.print(f"[green]✓[/green] Mind map created")
-            console.print(f"  ID: {result.get('artifact_id', 'unknown')}")
-            console.print(f"  Title: {result.get('title', 'Mind Map')}")
-        else:
-            console.print(f"[green]✓[/green] {label.title()} generation started")
-            console.print(f"  Artifact ID: {result.get('artifact_id', 'unknown')}")
-            console.print(f"\n[dim]Run 'nlm studio status {notebook_id}' to check progress.[/dim]")
-    except (ValidationError, ServiceError) as e:
-        msg = e.user_message if isinstance(e, ServiceError) else str(e)
-        console.print(f"[red]Error:[/red] {msg}")
-        if isinstance(e, ServiceError) and "rejected" in str(e):
-            console.print("[dim]Try again later or create from NotebookLM UI for diagnosis.[/dim]")
-        raise typer.Exit(1)
-    except NLMError as e:
-        console.print(f"[red]Error:[/red] {e.message}")
-        if e.hint:
-            console.print(f"\n[dim]Hint: {e.hint}[/dim]")
-        raise typer.Exit(1)
+    studio_service.validate_create_args(artifact_type, **kwargs)
+    confirm_action(prompt, confirm)
+    notebook_id = get_alias_manager().resolve(notebook_id)
+    with _spinner(f"Creating {label}..."), get_client(profile) as client:
+        result = studio_service.create_artifact(
+            client, notebook_id, artifact_type, **kwargs,
+        )
+
+    # Mind map has a different result shape
+    if artifact_type == "mind_map":
+        console.print(
+            f"[green]✓[/green] Mind map created\n"
+            f"  ID: {result.get('artifact_id', 'unknown')}\n"
+            f"  Title: {result.get('title', 'Mind Map')}"
+        )
+    else:
+        _print_started(label, result.get("artifact_id", "unknown"), notebook_id)
 
 
 # ========== Studio Status/Delete ==========
 
 @app.command("status")
+@cli_error_boundary
 def studio_status(
     notebook_id: str = typer.Argument(..., help="Notebook ID"),
     full: bool = typer.Option(False, "--full", "-a", help="Show all details"),
@@ -133,50 +157,47 @@ def studio_status(
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
 ) -> None:
     """List all studio artifacts and their status."""
-    try:
-        notebook_id = get_alias_manager().resolve(notebook_id)
-        with get_client(profile) as client:
-            artifacts = client.poll_studio_status(notebook_id)
-
-        fmt = detect_output_format(json_output)
-        formatter = get_formatter(fmt, console)
-        formatter.format_artifacts(artifacts, full=full)
-    except NLMError as e:
-        console.print(f"[red]Error:[/red] {e.message}")
-        if e.hint:
-            console.print(f"\n[dim]Hint: {e.hint}[/dim]")
-        raise typer.Exit(1)
+    notebook_id = get_alias_manager().resolve(notebook_id)
+    with get_client(profile) as client:
+        artifacts = client.poll_studio_status(notebook_id)
+
+    fmt = detect_output_format(json_output)
+    formatter = get_formatter(fmt, console)
+    formatter.format_artifacts(artifacts, full=full)
 
 
 @app.command("delete")
+@cli_error_boundary
 def studio_delete(
     notebook_id: str = typer.Argument(..., help="Notebook ID"),
-    artifact_id: str = typer.Argument(..., help="Artifact ID to delete"),
+    artifact_id: str = typer.Argument(..., help="Artifact ID to delete (comma-separate several IDs)"),
     confirm: bool = typer.Option(False, "--confirm", "-y", help="Skip confirmation"),
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
 ) -> None:
-    """Delete a studio artifact permanently."""
-    notebook_id = get_alias_manager().resolve(notebook_id)
-    artifact_id = get_alias_manager().resolve(artifact_id)
-
-    if not confirm:
-        typer.confirm(f"Are you sure you want to delete artifact {artifact_id}?", abort=True)
-
-    try:
-        with get_client(profile) as client:
-            studio_service.delete_artifact(client, artifact_id, notebook_id)
-        console.print(f"[green]✓[/green] Deleted artifact: {artifact_id}")
-    except ServiceError as e:
-        console.print(f"[red]Error:[/red] {e.user_message}")
-        raise typer.Exit(1)
-    except NLMError as e:
-        console.print(f"[red]Error:[/red] {e.message}")
-        if e.hint:
-            console.print(f"\n[dim]Hint: {e.hint}[/dim]")
+    """Delete one or more studio artifacts permanently."""
+    aliases = get_alias_manager()
+    notebook_id = aliases.resolve(notebook_id)
+    artifact_ids = parse_source_ids(artifact_id) or []
+    if not artifact_ids:
+        raise ValidationError("At least one artifact ID is required")
+
+    if len(artifact_ids) > 1:
+        confirm_action(f"Are you sure you want to delete {len(artifact_ids)} artifacts?", confirm)
+    else:
+        confirm_action(f"Are you sure you want to delete artifact {artifact_ids[0]}?", confirm)
+
+    with get_client(profile) as client:
+        result = studio_service.delete_artifacts(client, artifact_ids, notebook_id)
+    for deleted_id in result["deleted"]:
+        console.print(_OK, f"Deleted artifact: {deleted_id}", markup=False)
+    for failed_id, msg in result["failed"].items():
+        console.print(_ERR, f"{failed_id}: {msg}", markup=False)
+    if result["failed"]:
         raise typer.Exit(1)
 
 
 @app.command("rename")
+@cli_error_boundary
 def studio_rename(
     artifact_id: str = typer.Argument(..., help="Artifact ID to rename"),
     new_title: str = typer.Argument(..., help="New title for the artifact"),
@@ -185,18 +206,57 @@ def studio_rename(
     """Rename a studio artifact."""
     artifact_id = get_alias_manager().resolve(artifact_id)
 
+    with get_client(profile) as client:
+        result = studio_service.rename_artifact(client, artifact_id, new_title)
+    console.print(_OK, f"Renamed artifact to: {result['new_title']}", markup=False)
+
+
+@app.command("batch-create")
+@cli_error_boundary
+def studio_batch_create(
+    notebook_id: str = typer.Argument(..., help="Notebook ID"),
+    spec_file: Path = typer.Argument(
+        ..., help="JSON file with a list of artifact specs", exists=True, dir_okay=False,
+    ),
+    confirm: bool = typer.Option(False, "--confirm", "-y", help="Skip confirmation"),
+    profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
+) -> None:
+    """Create several artifacts at once from a JSON spec file.
+
+    Each entry has a "type" plus service options, e.g.
+    [{"type": "audio", "audio_format": "brief"}, {"type": "quiz", "question_count": 5}]
+    """
     try:
-        with get_client(profile) as client:
-            result = studio_service.rename_artifact(client, artifact_id, new_title)
-        console.print(f"[green]✓[/green] Renamed artifact to: {result['new_title']}")
-    except (ValidationError, ServiceError) as e:
-        msg = e.user_message if isinstance(e, ServiceError) else str(e)
-        console.print(f"[red]Error:[/red] {msg}")
+        specs = json.loads(spec_file.read_text())
+    except (OSError, json.JSONDecodeError) as e:
+        console.print(f"[red]Error:[/red] Could not read {spec_file}: {e}")
         raise typer.Exit(1)
-    except NLMError as e:
-        console.print(f"[red]Error:[/red] {e.message}")
-        if e.hint:
-            console.print(f"\n[dim]Hint: {e.hint}[/dim]")
+    if not isinstance(specs, list):
+        console.print("[red]Error:[/red] Spec file must contain a JSON list")
+        raise typer.Exit(1)
+
+    # Validate first so malformed values never reach alias resolution
+    studio_service.validate_artifact_specs(specs)
+    aliases = get_alias_manager()
+    notebook_id = aliases.resolve(notebook_id)
+    for spec in specs:
+        if spec.get("source_ids"):
+            ids = spec["source_ids"]
+            spec["source_ids"] = (
+                parse_source_ids(ids) if isinstance(ids, str) else aliases.resolve_many(ids)
+            )
+
+    confirm_action(f"Create {len(specs)} artifacts?", confirm)
+    with _spinner(f"Creating {len(specs)} artifacts..."), get_client(profile) as client:
+        result = studio_service.create_artifacts(client, notebook_id, specs)
+
+    for created in result["created"]:
+        label = created["artifact_type"].replace("_", " ")
+        console.print(_OK, f"{label.title()}: {created['artifact_id']}", markup=False)
+    for index, msg in result["failed"].items():
+        console.print(_ERR, f"spec #{index + 1} ({specs[index]['type']}): {msg}", markup=False)
+    console.print(f"\n[dim]Run 'nlm studio status {notebook_id}' to check progress.[/dim]")
+    if result["failed"]:
         raise typer.Exit(1)
 
 
@@ -207,10 +267,12 @@ def create_audio(
     notebook_id: str = typer.Argument(..., help="Notebook ID"),
     format: str = typer.Option(
         "deep_dive", "--format", "-f",
+        callback=code_choice(constants.AUDIO_FORMATS),
         help="Overview format (deep_dive, brief, critique, debate)",
     ),
     length: str = typer.Option(
         "default", "--length", "-l",
+        callback=code_choice(constants.AUDIO_LENGTHS),
         help="Length (short, default, long)",
     ),
     language: str = typer.Option(
@@ -229,12 +291,10 @@ def create_audio(
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
 ) -> None:
     """Create an audio overview (podcast) from notebook sources."""
-    if not confirm:
-        typer.confirm(f"Create {format} audio overview?", abort=True)
-
     _run_create(
         notebook_id, "audio", "audio",
-        profile=profile,
+        profile=profile, confirm=confirm,
+        prompt=f"Create {format} audio overview?",
         source_ids=parse_source_ids(source_ids),
         audio_format=format, audio_length=length,
         language=language, focus_prompt=focus or "",
@@ -261,12 +321,10 @@ def create_report(
         console.print("[red]Error:[/red] --prompt is required when format is 'Create Your Own'")
         raise typer.Exit(1)
 
-    if not confirm:
-        typer.confirm(f"Create '{format}' report?", abort=True)
-
     _run_create(
         notebook_id, "report", "report",
-        profile=profile,
+        profile=profile, confirm=confirm,
+        prompt=f"Create '{format}' report?",
         source_ids=parse_source_ids(source_ids),
         report_format=format, custom_prompt=prompt,
         language=language,
@@ -275,7 +333,16 @@ def create_report(
 
 # ========== Quiz ==========
 
+def _validate_quiz_args(count: int, difficulty: int) -> None:
+    """Reject out-of-range quiz options before prompting or calling the API."""
+    if count < 1:
+        raise ValidationError("--count must be at least 1")
+    if not 1 <= difficulty <= 5:
+        raise ValidationError("--difficulty must be between 1 and 5")
+
+
 @quiz_app.command("create")
+@cli_error_boundary
 def create_quiz(
     notebook_id: str = typer.Argument(..., help="Notebook ID"),
     count: int = typer.Option(2, "--count", "-c", help="Number of questions"),
@@ -286,40 +353,27 @@ def create_quiz(
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
 ) -> None:
     """Create a quiz from notebook sources."""
-    if not confirm:
-        typer.confirm(f"Create quiz with {count} questions?", abort=True)
+    _validate_quiz_args(count, difficulty)
+    confirm_action(f"Create quiz with {count} questions?", confirm)
 
     # Quiz CLI sends raw int codes directly — bypass service string resolution
-    try:
-        notebook_id_resolved = get_alias_manager().resolve(notebook_id)
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            progress.add_task("Creating quiz...", total=None)
-            with get_client(profile) as client:
-                result = client.create_quiz(
-                    notebook_id_resolved,
-                    question_count=count,
-                    difficulty=difficulty,
-                    source_ids=parse_source_ids(source_ids),
-                    focus_prompt=focus or "",
-                )
-
-        if not result or not result.get("artifact_id"):
-            console.print("[red]Error:[/red] NotebookLM rejected quiz creation (no artifact returned).")
-            console.print("[dim]Try again later or create from NotebookLM UI for diagnosis.[/dim]")
-            raise typer.Exit(1)
-
-        console.print("[green]✓[/green] Quiz generation started")
-        console.print(f"  Artifact ID: {result.get('artifact_id', 'unknown')}")
-        console.print(f"\n[dim]Run 'nlm studio status {notebook_id_resolved}' to check progress.[/dim]")
-    except NLMError as e:
-        console.print(f"[red]Error:[/red] {e.message}")
-        if e.hint:
-            console.print(f"\n[dim]Hint: {e.hint}[/dim]")
-        raise typer.Exit(1)
+    notebook_id_resolved = get_alias_manager().resolve(notebook_id)
+    with _spinner("Creating quiz..."), get_client(profile) as client:
+        result = client.create_quiz(
+            notebook_id_resolved,
+            question_count=count,
+            difficulty=difficulty,
+            source_ids=parse_source_ids(source_ids),
+            focus_prompt=focus or "",
+        )
+
+    if not result or not result.get("artifact_id"):
+        raise ServiceError(
+            "NotebookLM rejected quiz creation (no artifact returned).",
+            hint=studio_service.REJECTION_HINT,
+        )
+
+    _print_started("quiz", result.get("artifact_id", "unknown"), notebook_id_resolved)
 
 
 # ========== Flashcards ==========
@@ -327,19 +381,17 @@ def create_quiz(
 @flashcards_app.command("create")
 def create_flashcards(
     notebook_id: str = typer.Argument(..., help="Notebook ID"),
-    difficulty: str = typer.Option("medium", "--difficulty", "-d", help="Difficulty: easy, medium, hard"),
+    difficulty: str = typer.Option("medium", "--difficulty", "-d", callback=code_choice(constants.FLASHCARD_DIFFICULTIES), help="Difficulty: easy, medium, hard"),
     focus: Optional[str] = typer.Option(None, "--focus", "-f", help="Focus prompt to guide generation"),
     source_ids: Optional[str] = typer.Option(None, "--source-ids", "-s", help="Comma-separated source IDs"),
     confirm: bool = typer.Option(False, "--confirm", "-y", help="Skip confirmation"),
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
 ) -> None:
     """Create flashcards from notebook sources."""
-    if not confirm:
-        typer.confirm("Create flashcards?", abort=True)
-
     _run_create(
         notebook_id, "flashcards", "flashcards",
-        profile=profile,
+        profile=profile, confirm=confirm,
+        prompt="Create flashcards?",
         source_ids=parse_source_ids(source_ids),
         difficulty=difficulty,
         focus_prompt=focus or "",
@@ -357,12 +409,10 @@ def create_mindmap(
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
 ) -> None:
     """Create a mind map from notebook sources."""
-    if not confirm:
-        typer.confirm("Create mind map?", abort=True)
-
     _run_create(
         notebook_id, "mind_map", "mind map",
-        profile=profile,
+        profile=profile, confirm=confirm,
+        prompt="Create mind map?",
         source_ids=parse_source_ids(source_ids),
         title=title,
     )
@@ -376,8 +426,8 @@ def create_mindmap(
 @slides_app.command("create")
 def create_slides(
     notebook_id: str = typer.Argument(..., help="Notebook ID"),
-    format: str = typer.Option("detailed_deck", "--format", "-f", help="Format: detailed_deck, presenter_slides"),
-    length: str = typer.Option("default", "--length", "-l", help="Length: short, default"),
+    format: str = typer.Option("detailed_deck", "--format", "-f", callback=code_choice(constants.SLIDE_DECK_FORMATS), help="Format: detailed_deck, presenter_slides"),
+    length: str = typer.Option("default", "--length", "-l", callback=code_choice(constants.SLIDE_DECK_LENGTHS), help="Length: short, default"),
     language: str = typer.Option("en", "--language", help="BCP-47 language code"),
     focus: str = typer.Option("", "--focus", help="Optional focus topic"),
     source_ids: Optional[str] = typer.Option(None, "--source-ids", "-s", help="Comma-separated source IDs"),
@@ -385,12 +435,10 @@ def create_slides(
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
 ) -> None:
     """Create a slide deck from notebook sources."""
-    if not confirm:
-        typer.confirm("Create slide deck?", abort=True)
-
     _run_create(
         notebook_id, "slide_deck", "slide deck",
-        profile=profile,
+        profile=profile, confirm=confirm,
+        prompt="Create slide deck?",
         source_ids=parse_source_ids(source_ids),
         slide_format=format, slide_length=length,
         language=language, focus_prompt=focus,
@@ -402,8 +450,8 @@ def create_slides(
 @infographic_app.command("create")
 def create_infographic(
     notebook_id: str = typer.Argument(..., help="Notebook ID"),
-    orientation: str = typer.Option("landscape", "--orientation", "-o", help="Orientation: landscape, portrait, square"),
-    detail: str = typer.Option("standard", "--detail", "-d", help="Detail level: concise, standard, detailed"),
+    orientation: str = typer.Option("landscape", "--orientation", "-o", callback=code_choice(constants.INFOGRAPHIC_ORIENTATIONS), help="Orientation: landscape, portrait, square"),
+    detail: str = typer.Option("standard", "--detail", "-d", callback=code_choice(constants.INFOGRAPHIC_DETAILS), help="Detail level: concise, standard, detailed"),
     language: str = typer.Option("en", "--language", help="BCP-47 language code"),
     focus: str = typer.Option("", "--focus", help="Optional focus topic"),
     source_ids: Optional[str] = typer.Option(None, "--source-ids", "-s", help="Comma-separated source IDs"),
@@ -411,12 +459,10 @@ def create_infographic(
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
 ) -> None:
     """Create an infographic from notebook sources."""
-    if not confirm:
-        typer.confirm("Create infographic?", abort=True)
-
     _run_create(
         notebook_id, "infographic", "infographic",
-        profile=profile,
+        profile=profile, confirm=confirm,
+        prompt="Create infographic?",
         source_ids=parse_source_ids(source_ids),
         orientation=orientation, detail_level=detail,
         language=language, focus_prompt=focus,
@@ -428,9 +474,10 @@ def create_infographic(
 @video_app.command("create")
 def create_video(
     notebook_id: str = typer.Argument(..., help="Notebook ID"),
-    format: str = typer.Option("explainer", "--format", "-f", help="Format: explainer, brief"),
+    format: str = typer.Option("explainer", "--format", "-f", callback=code_choice(constants.VIDEO_FORMATS), help="Format: explainer, brief"),
     style: str = typer.Option(
         "auto_select", "--style", "-s",
+        callback=code_choice(constants.VIDEO_STYLES),
         help="Visual style: auto_select, classic, whiteboard, kawaii, anime, watercolor, retro_print, heritage, paper_craft",
     ),
     language: str = typer.Option("en", "--language", help="BCP-47 language code"),
@@ -440,12 +487,10 @@ def create_video(
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
 ) -> None:
     """Create a video overview from notebook sources."""
-    if not confirm:
-        typer.confirm("Create video overview?", abort=True)
-
     _run_create(
         notebook_id, "video", "video",
-        profile=profile,
+        profile=profile, confirm=confirm,
+        prompt="Create video overview?",
         source_ids=parse_source_ids(source_ids),
         video_format=format, visual_style=style,
         language=language, focus_prompt=focus,
@@ -464,12 +509,10 @@ def create_data_table(
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
 ) -> None:
     """Create a data table from notebook sources."""
-    if not confirm:
-        typer.confirm("Create data table?", abort=True)
-
     _run_create(
         notebook_id, "data_table", "data table",
-        profile=profile,
+        profile=profile, confirm=confirm,
+        prompt="Create data table?",
         source_ids=parse_source_ids(source_ids),
         description=description, language=language,
     )
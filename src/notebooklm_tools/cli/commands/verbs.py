@@ -8,10 +8,15 @@ This module provides alternative command structure:
 Both command structures coexist for user flexibility.
 """
 
+from pathlib import Path
 from typing import Optional
 
 import typer
 
+from notebooklm_tools.cli.utils import code_choice, name_choice
+from notebooklm_tools.core import constants
+from notebooklm_tools.services.sources import VALID_DRIVE_DOC_TYPES
+
 # Import existing command implementations
 from notebooklm_tools.cli.commands.notebook import (
     create_notebook,
@@ -25,6 +30,7 @@ from notebooklm_tools.cli.commands.notebook import (
 from notebooklm_tools.cli.commands.source import (
     list_sources,
     add_source,
+    add_sources_batch,
     get_source,
     describe_source,
     get_source_content,
@@ -36,6 +42,7 @@ from notebooklm_tools.cli.commands.studio import (
     studio_status,
     studio_delete,
     studio_rename,
+    studio_batch_create,
     create_audio,
     create_video,
     create_report,
@@ -54,15 +61,6 @@ from notebooklm_tools.cli.commands.research import (
 from notebooklm_tools.cli.commands.chat import (
     configure_chat,
 )
-from notebooklm_tools.cli.commands.download import (
-    download_audio,
-    download_video,
-    download_report,
-    download_mind_map,
-    download_slide_deck,
-    download_infographic,
-    download_data_table,
-)
 from notebooklm_tools.cli.commands.alias import (
     set_alias,
     get_alias,
@@ -101,9 +99,9 @@ def create_notebook_verb(
 @create_app.command("audio")
 def create_audio_verb(
     notebook: str = typer.Argument(..., help="Notebook ID or alias"),
-    format_opt: Optional[str] = typer.Option(None, "--format", "-f", help="Audio format (deep_dive/brief/critique/debate)"),
-    length: Optional[str] = typer.Option(None, "--length", "-l", help="Audio length (short/default/long)"),
-    language: Optional[str] = typer.Option(None, "--language", help="BCP-47 language code (en, es, fr, de, ja)"),
+    format_opt: str = typer.Option("deep_dive", "--format", "-f", callback=code_choice(constants.AUDIO_FORMATS), help="Audio format (deep_dive/brief/critique/debate)"),
+    length: str = typer.Option("default", "--length", "-l", callback=code_choice(constants.AUDIO_LENGTHS), help="Audio length (short/default/long)"),
+    language: str = typer.Option("en", "--language", help="BCP-47 language code (en, es, fr, de, ja)"),
     focus: Optional[str] = typer.Option(None, "--focus", help="Optional focus topic"),
     source_ids: Optional[str] = typer.Option(None, "--source-ids", "-s", help="Comma-separated source IDs"),
     confirm: bool = typer.Option(False, "--confirm", "-y", help="Skip confirmation prompt"),
@@ -112,9 +110,9 @@ def create_audio_verb(
     """Create an audio overview."""
     create_audio(
         notebook_id=notebook,
-        format=format_opt or "deep_dive",
-        length=length or "default",
-        language=language or "en",
+        format=format_opt,
+        length=length,
+        language=language,
         focus=focus,
         source_ids=source_ids,
         confirm=confirm,
@@ -125,10 +123,10 @@ def create_audio_verb(
 @create_app.command("video")
 def create_video_verb(
     notebook: str = typer.Argument(..., help="Notebook ID or alias"),
-    format_opt: Optional[str] = typer.Option(None, "--format", "-f", help="Format: explainer, brief"),
-    style: Optional[str] = typer.Option(None, "--style", "-s", help="Visual style: auto_select, classic, whiteboard, kawaii, anime, watercolor, retro_print, heritage, paper_craft"),
-    language: Optional[str] = typer.Option(None, "--language", help="BCP-47 language code"),
-    focus: Optional[str] = typer.Option(None, "--focus", help="Optional focus topic"),
+    format_opt: str = typer.Option("explainer", "--format", "-f", callback=code_choice(constants.VIDEO_FORMATS), help="Format: explainer, brief"),
+    style: str = typer.Option("auto_select", "--style", "-s", callback=code_choice(constants.VIDEO_STYLES), help="Visual style: auto_select, classic, whiteboard, kawaii, anime, watercolor, retro_print, heritage, paper_craft"),
+    language: str = typer.Option("en", "--language", help="BCP-47 language code"),
+    focus: str = typer.Option("", "--focus", help="Optional focus topic"),
     source_ids: Optional[str] = typer.Option(None, "--source-ids", help="Comma-separated source IDs"),
     confirm: bool = typer.Option(False, "--confirm", "-y", help="Skip confirmation prompt"),
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
@@ -136,10 +134,10 @@ def create_video_verb(
     """Create a video overview."""
     create_video(
         notebook_id=notebook,
-        format=format_opt or "explainer",
-        style=style or "auto_select",
-        language=language or "en",
-        focus=focus or "",
+        format=format_opt,
+        style=style,
+        language=language,
+        focus=focus,
         source_ids=source_ids,
         confirm=confirm,
         profile=profile
@@ -149,9 +147,9 @@ def create_video_verb(
 @create_app.command("report")
 def create_report_verb(
     notebook: str = typer.Argument(..., help="Notebook ID or alias"),
-    format_opt: Optional[str] = typer.Option(None, "--format", "-f", help="Format: 'Briefing Doc', 'Study Guide', 'Blog Post', 'Create Your Own'"),
-    prompt: Optional[str] = typer.Option(None, "--prompt", help="Custom prompt (required for 'Create Your Own')"),
-    language: Optional[str] = typer.Option(None, "--language", help="BCP-47 language code"),
+    format_opt: str = typer.Option("Briefing Doc", "--format", "-f", help="Format: 'Briefing Doc', 'Study Guide', 'Blog Post', 'Create Your Own'"),
+    prompt: str = typer.Option("", "--prompt", help="Custom prompt (required for 'Create Your Own')"),
+    language: str = typer.Option("en", "--language", help="BCP-47 language code"),
     source_ids: Optional[str] = typer.Option(None, "--source-ids", "-s", help="Comma-separated source IDs"),
     confirm: bool = typer.Option(False, "--confirm", "-y", help="Skip confirmation prompt"),
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
@@ -159,9 +157,9 @@ def create_report_verb(
     """Create a report."""
     create_report(
         notebook_id=notebook,
-        format=format_opt or "Briefing Doc",
-        prompt=prompt or "",
-        language=language or "en",
+        format=format_opt,
+        prompt=prompt,
+        language=language,
         source_ids=source_ids,
         confirm=confirm,
         profile=profile
@@ -171,10 +169,10 @@ def create_report_verb(
 @create_app.command("infographic")
 def create_infographic_verb(
     notebook: str = typer.Argument(..., help="Notebook ID or alias"),
-    orientation: Optional[str] = typer.Option(None, "--orientation", "-o", help="Orientation: landscape, portrait, square"),
-    detail: Optional[str] = typer.Option(None, "--detail", "-d", help="Detail level: concise, standard, detailed"),
-    language: Optional[str] = typer.Option(None, "--language", help="BCP-47 language code"),
-    focus: Optional[str] = typer.Option(None, "--focus", help="Optional focus topic"),
+    orientation: str = typer.Option("landscape", "--orientation", "-o", callback=code_choice(constants.INFOGRAPHIC_ORIENTATIONS), help="Orientation: landscape, portrait, square"),
+    detail: str = typer.Option("standard", "--detail", "-d", callback=code_choice(constants.INFOGRAPHIC_DETAILS), help="Detail level: concise, standard, detailed"),
+    language: str = typer.Option("en", "--language", help="BCP-47 language code"),
+    focus: str = typer.Option("", "--focus", help="Optional focus topic"),
     source_ids: Optional[str] = typer.Option(None, "--source-ids", "-s", help="Comma-separated source IDs"),
     confirm: bool = typer.Option(False, "--confirm", "-y", help="Skip confirmation prompt"),
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
@@ -182,10 +180,10 @@ def create_infographic_verb(
     """Create an infographic."""
     create_infographic(
         notebook_id=notebook,
-        orientation=orientation or "landscape",
-        detail=detail or "standard",
-        language=language or "en",
-        focus=focus or "",
+        orientation=orientation,
+        detail=detail,
+        language=language,
+        focus=focus,
         source_ids=source_ids,
         confirm=confirm,
         profile=profile
@@ -195,10 +193,10 @@ def create_infographic_verb(
 @create_app.command("slides")
 def create_slides_verb(
     notebook: str = typer.Argument(..., help="Notebook ID or alias"),
-    format_opt: Optional[str] = typer.Option(None, "--format", "-f", help="Format: detailed, presenter"),
-    length: Optional[str] = typer.Option(None, "--length", "-l", help="Length: short, default"),
-    language: Optional[str] = typer.Option(None, "--language", help="BCP-47 language code"),
-    focus: Optional[str] = typer.Option(None, "--focus", help="Optional focus topic"),
+    format_opt: str = typer.Option("detailed_deck", "--format", "-f", callback=code_choice(constants.SLIDE_DECK_FORMATS), help="Format: detailed_deck, presenter_slides"),
+    length: str = typer.Option("default", "--length", "-l", callback=code_choice(constants.SLIDE_DECK_LENGTHS), help="Length: short, default"),
+    language: str = typer.Option("en", "--language", help="BCP-47 language code"),
+    focus: str = typer.Option("", "--focus", help="Optional focus topic"),
     source_ids: Optional[str] = typer.Option(None, "--source-ids", "-s", help="Comma-separated source IDs"),
     confirm: bool = typer.Option(False, "--confirm", "-y", help="Skip confirmation prompt"),
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
@@ -206,10 +204,10 @@ def create_slides_verb(
     """Create a slide deck."""
     create_slides(
         notebook_id=notebook,
-        format=format_opt or "detailed",
-        length=length or "default",
-        language=language or "en",
-        focus=focus or "",
+        format=format_opt,
+        length=length,
+        language=language,
+        focus=focus,
         source_ids=source_ids,
         confirm=confirm,
         profile=profile
@@ -219,8 +217,8 @@ def create_slides_verb(
 @create_app.command("quiz")
 def create_quiz_verb(
     notebook: str = typer.Argument(..., help="Notebook ID or alias"),
-    count: Optional[int] = typer.Option(None, "--count", "-c", help="Number of questions"),
-    difficulty: Optional[int] = typer.Option(None, "--difficulty", "-d", help="Difficulty 1-5 (1=easy, 5=hard)"),
+    count: int = typer.Option(2, "--count", "-c", help="Number of questions"),
+    difficulty: int = typer.Option(2, "--difficulty", "-d", help="Difficulty 1-5 (1=easy, 5=hard)"),
     source_ids: Optional[str] = typer.Option(None, "--source-ids", "-s", help="Comma-separated source IDs"),
     confirm: bool = typer.Option(False, "--confirm", "-y", help="Skip confirmation prompt"),
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
@@ -228,8 +226,9 @@ def create_quiz_verb(
     """Create a quiz."""
     create_quiz(
         notebook_id=notebook,
-        count=count or 2,
-        difficulty=difficulty or 2,
+        count=count,
+        difficulty=difficulty,
+        focus=None,
         source_ids=source_ids,
         confirm=confirm,
         profile=profile
@@ -239,7 +238,7 @@ def create_quiz_verb(
 @create_app.command("flashcards")
 def create_flashcards_verb(
     notebook: str = typer.Argument(..., help="Notebook ID or alias"),
-    difficulty: Optional[str] = typer.Option(None, "--difficulty", "-d", help="Difficulty: easy, medium, hard"),
+    difficulty: str = typer.Option("medium", "--difficulty", "-d", callback=code_choice(constants.FLASHCARD_DIFFICULTIES), help="Difficulty: easy, medium, hard"),
     source_ids: Optional[str] = typer.Option(None, "--source-ids", "-s", help="Comma-separated source IDs"),
     confirm: bool = typer.Option(False, "--confirm", "-y", help="Skip confirmation prompt"),
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
@@ -247,7 +246,7 @@ def create_flashcards_verb(
     """Create flashcards."""
     create_flashcards(
         notebook_id=notebook,
-        difficulty=difficulty or "medium",
+        difficulty=difficulty,
         source_ids=source_ids,
         confirm=confirm,
         profile=profile
@@ -258,7 +257,7 @@ def create_flashcards_verb(
 def create_data_table_verb(
     notebook: str = typer.Argument(..., help="Notebook ID or alias"),
     description: str = typer.Argument(..., help="Description of the data table to create"),
-    language: Optional[str] = typer.Option(None, "--language", help="BCP-47 language code"),
+    language: str = typer.Option("en", "--language", help="BCP-47 language code"),
     source_ids: Optional[str] = typer.Option(None, "--source-ids", "-s", help="Comma-separated source IDs"),
     confirm: bool = typer.Option(False, "--confirm", "-y", help="Skip confirmation prompt"),
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
@@ -267,7 +266,7 @@ def create_data_table_verb(
     create_data_table(
         notebook_id=notebook,
         description=description,
-        language=language or "en",
+        language=language,
         source_ids=source_ids,
         confirm=confirm,
         profile=profile
@@ -277,7 +276,7 @@ def create_data_table_verb(
 @create_app.command("mindmap")
 def create_mindmap_verb(
     notebook: str = typer.Argument(..., help="Notebook ID or alias"),
-    title: Optional[str] = typer.Option(None, "--title", "-t", help="Mind map title"),
+    title: str = typer.Option("Mind Map", "--title", "-t", help="Mind map title"),
     source_ids: Optional[str] = typer.Option(None, "--source-ids", "-s", help="Comma-separated source IDs"),
     confirm: bool = typer.Option(False, "--confirm", "-y", help="Skip confirmation prompt"),
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
@@ -285,13 +284,31 @@ def create_mindmap_verb(
     """Create a mind map."""
     create_mindmap(
         notebook_id=notebook,
-        title=title or "Mind Map",
+        title=title,
         source_ids=source_ids,
         confirm=confirm,
         profile=profile
     )
 
 
+@create_app.command("batch")
+def create_batch_verb(
+    notebook: str = typer.Argument(..., help="Notebook ID or alias"),
+    spec_file: Path = typer.Argument(
+        ..., help="JSON file with a list of artifact specs", exists=True, dir_okay=False,
+    ),
+    confirm: bool = typer.Option(False, "--confirm", "-y", help="Skip confirmation prompt"),
+    profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
+) -> None:
+    """Create several artifacts at once from a JSON spec file."""
+    studio_batch_create(
+        notebook_id=notebook,
+        spec_file=spec_file,
+        confirm=confirm,
+        profile=profile
+    )
+
+
 # =============================================================================
 # LIST verb
 # =============================================================================
@@ -483,7 +500,7 @@ def add_drive_verb(
     notebook: str = typer.Argument(..., help="Notebook ID or alias"),
     document_id: str = typer.Argument(..., help="Google Drive document ID"),
     title: Optional[str] = typer.Option(None, "--title", help="Source title"),
-    doc_type: str = typer.Option("doc", "--type", help="Drive doc type: doc, slides, sheets, pdf"),
+    doc_type: str = typer.Option("doc", "--type", callback=name_choice(VALID_DRIVE_DOC_TYPES), help="Drive doc type: doc, slides, sheets, pdf"),
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
 ) -> None:
     """Add a Google Drive source to notebook."""
@@ -491,6 +508,23 @@ def add_drive_verb(
     add_source(notebook, url=None, text=None, drive=document_id, youtube=None, file=None, title=title or f"Drive Document ({document_id[:8]}...)", doc_type=doc_type, profile=profile)
 
 
+@add_app.command("batch")
+def add_batch_verb(
+    notebook: str = typer.Argument(..., help="Notebook ID or alias"),
+    urls_file: Optional[Path] = typer.Option(
+        None, "--urls-file", help="File with one URL per line", exists=True, dir_okay=False,
+    ),
+    drive_ids_file: Optional[Path] = typer.Option(
+        None, "--drive-ids-file", help="File with one Drive document ID per line",
+        exists=True, dir_okay=False,
+    ),
+    doc_type: str = typer.Option("doc", "--type", callback=name_choice(VALID_DRIVE_DOC_TYPES), help="Drive doc type: doc, slides, sheets, pdf"),
+    profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
+) -> None:
+    """Add many URL/Drive sources to notebook in one request."""
+    add_sources_batch(notebook, urls_file=urls_file, drive_ids_file=drive_ids_file, doc_type=doc_type, profile=profile)
+
+
 # =============================================================================
 # RENAME verb
 # =============================================================================
@@ -673,11 +707,14 @@ research_app = typer.Typer(help="Research and discover sources")
 @research_app.command("start")
 def research_start_verb(
     query: str = typer.Argument(..., help="What to search for"),
-    source: str = typer.Option("web", "--source", "-s", help="Where to search: web or drive"),
-    mode: str = typer.Option("fast", "--mode", "-m", help="Research mode: fast (~30s, ~10 sources) or deep (~5min, ~40 sources, web only)"),
+    source: str = typer.Option("web", "--source", "-s", callback=code_choice(constants.RESEARCH_SOURCES), help="Where to search: web or drive"),
+    mode: str = typer.Option("fast", "--mode", "-m", callback=code_choice(constants.RESEARCH_MODES), help="Research mode: fast (~30s, ~10 sources) or deep (~5min, ~40 sources, web only)"),
     notebook_id: Optional[str] = typer.Option(None, "--notebook-id", "-n", help="Add to existing notebook"),
     title: Optional[str] = typer.Option(None, "--title", "-t", help="Title for new notebook"),
     force: bool = typer.Option(False, "--force", "-f", help="Start new research even if one is already pending"),
+    wait: bool = typer.Option(False, "--wait", "-w", help="Wait for the research to finish and show the results"),
+    import_all: bool = typer.Option(False, "--import", help="Wait, then import every discovered source (implies --wait)"),
+    max_wait: int = typer.Option(900, "--max-wait", help="Maximum seconds to wait with --wait/--import"),
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
 ) -> None:
     """Start a research task to find new sources."""
@@ -688,6 +725,9 @@ def research_start_verb(
         notebook_id=notebook_id,
         title=title,
         force=force,
+        wait=wait,
+        import_all=import_all,
+        max_wait=max_wait,
         profile=profile
     )
 
@@ -718,134 +758,21 @@ configure_app = typer.Typer(help="Configure settings")
 @configure_app.command("chat")
 def configure_chat_verb(
     notebook: str = typer.Argument(..., help="Notebook ID or alias"),
-    goal: Optional[str] = typer.Option(None, "--goal", "-g", help="Chat goal: default, learning_guide, or custom"),
+    goal: str = typer.Option("default", "--goal", "-g", callback=code_choice(constants.CHAT_GOALS), help="Chat goal: default, learning_guide, or custom"),
     prompt: Optional[str] = typer.Option(None, "--prompt", help="Custom prompt (required when goal=custom, max 10000 chars)"),
-    response_length: Optional[str] = typer.Option(None, "--response-length", "-r", help="Response length: default, longer, or shorter"),
+    response_length: str = typer.Option("default", "--response-length", "-r", callback=code_choice(constants.CHAT_RESPONSE_LENGTHS), help="Response length: default, longer, or shorter"),
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Profile to use"),
 ) -> None:
     """Configure chat settings for a notebook."""
     configure_chat(
         notebook_id=notebook,
-        goal=goal or "default",
+        goal=goal,
         prompt=prompt,
-        response_length=response_length or "default",
+        response_length=response_length,
         profile=profile
     )
 
 
-# =============================================================================
-# DOWNLOAD verb
-# =============================================================================
-
-download_app = typer.Typer(help="Download studio artifacts")
-
-
-@download_app.command("audio")
-def download_audio_verb(
-    notebook: str = typer.Argument(..., help="Notebook ID or alias"),
-    output: Optional[str] = typer.Option(None, "--output", "-o", help="Output filename"),
-    artifact_id: Optional[str] = typer.Option(None, "--id", help="Specific artifact ID"),
-    no_progress: bool = typer.Option(False, "--no-progress", help="Disable download progress bar"),
-) -> None:
-    """Download audio overview."""
-    download_audio(
-        notebook_id=notebook,
-        output=output,
-        artifact_id=artifact_id,
-        no_progress=no_progress
-    )
-
-
-@download_app.command("video")
-def download_video_verb(
-    notebook: str = typer.Argument(..., help="Notebook ID or alias"),
-    output: Optional[str] = typer.Option(None, "--output", "-o", help="Output filename"),
-    artifact_id: Optional[str] = typer.Option(None, "--id", help="Specific artifact ID"),
-    no_progress: bool = typer.Option(False, "--no-progress", help="Disable download progress bar"),
-) -> None:
-    """Download video overview."""
-    download_video(
-        notebook_id=notebook,
-        output=output,
-        artifact_id=artifact_id,
-        no_progress=no_progress
-    )
-
-
-@download_app.command("report")
-def download_report_verb(
-    notebook: str = typer.Argument(..., help="Notebook ID or alias"),
-    output: Optional[str] = typer.Option(None, "--output", "-o", help="Output filename"),
-    artifact_id: Optional[str] = typer.Option(None, "--id", help="Specific artifact ID"),
-) -> None:
-    """Download report."""
-    download_report(
-        notebook_id=notebook,
-        output=output,
-        artifact_id=artifact_id
-    )
-
-
-@download_app.command("mind-map")
-def download_mindmap_verb(
-    notebook: str = typer.Argument(..., help="Notebook ID or alias"),
-    output: Optional[str] = typer.Option(None, "--output", "-o", help="Output filename"),
-    artifact_id: Optional[str] = typer.Option(None, "--id", help="Specific artifact ID (note ID)"),
-) -> None:
-    """Download mind map."""
-    download_mind_map(
-        notebook_id=notebook,
-        output=output,
-        artifact_id=artifact_id
-    )
-
-
-@download_app.command("slides")
-def download_slides_verb(
-    notebook: str = typer.Argument(..., help="Notebook ID or alias"),
-    output: Optional[str] = typer.Option(None, "--output", "-o", help="Output filename"),
-    artifact_id: Optional[str] = typer.Option(None, "--id", help="Specific artifact ID"),
-    no_progress: bool = typer.Option(False, "--no-progress", help="Disable download progress bar"),
-) -> None:
-    """Download slide deck."""
-    download_slide_deck(
-        notebook_id=notebook,
-        output=output,
-        artifact_id=artifact_id,
-        no_progress=no_progress
-    )
-
-
-@download_app.command("infographic")
-def download_infographic_verb(
-    notebook: str = typer.Argument(..., help="Notebook ID or alias"),
-    output: Optional[str] = typer.Option(None, "--output", "-o", help="Output filename"),
-    artifact_id: Optional[str] = typer.Option(None, "--id", help="Specific artifact ID"),
-    no_progress: bool = typer.Option(False, "--no-progress", help="Disable download progress bar"),
-) -> None:
-    """Download infographic."""
-    download_infographic(
-        notebook_id=notebook,
-        output=output,
-        artifact_id=artifact_id,
-        no_progress=no_progress
-    )
-
-
-@download_app.command("data-table")
-def download_data_table_verb(
-    notebook: str = typer.Argument(..., help="Notebook ID or alias"),
-    output: Optional[str] = typer.Option(None, "--output", "-o", help="Output filename"),
-    artifact_id: Optional[str] = typer.Option(None, "--id", help="Specific artifact ID"),
-) -> None:
-    """Download data table."""
-    download_data_table(
-        notebook_id=notebook,
-        output=output,
-        artifact_id=artifact_id
-    )
-
-
 # =============================================================================
 # SET verb (for aliases and config)
 # =============================================================================
@@ -1,13 +1,26 @@
 """Output formatting utilities for NLM CLI."""
 
-import json
 import sys
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
 from rich.console import Console
 from rich.table import Table
 
+from notebooklm_tools.utils import json_utils
+
+# Artifact status markup with color and Unicode symbol for quick scanning
+_STATUS_DISPLAY = {
+    status: f"[{style}]{symbol} {status}[/{style}]"
+    for status, (style, symbol) in {
+        "completed": ("green", "✓"),
+        "pending": ("yellow", "●"),
+        "in_progress": ("yellow", "●"),
+        "failed": ("red", "✗"),
+    }.items()
+}
+
 
 class OutputFormat(str, Enum):
     """Output format options."""
@@ -228,25 +241,11 @@ class TableFormatter(Formatter):
                 art_title = getattr(art, 'title', '')
                 art_url = getattr(art, 'url', '')
             
-            # Status with color and Unicode symbol for quick scanning
-            status_config = {
-                'completed': ('green', '✓'),
-                'pending': ('yellow', '●'),
-                'in_progress': ('yellow', '●'),
-                'failed': ('red', '✗'),
-            }
-            
-            if art_status in status_config:
-                style, symbol = status_config[art_status]
-                status_display = f'[{style}]{symbol} {art_status}[/{style}]'
-            else:
-                status_display = art_status
-            
             row = [
                 art_id,
                 art_title or '-',
                 art_type,
-                status_display,
+                _STATUS_DISPLAY.get(art_status, art_status),
             ]
             if full:
                 row.append(art_url or '-')
@@ -268,12 +267,14 @@ class TableFormatter(Formatter):
         for key, value in data.items():
             # Special handling for sources list
             if key == "sources" and isinstance(value, list):
-                self.console.print(f"  [cyan]{key}:[/cyan]")
+                lines = [f"  [cyan]{key}:[/cyan]"]
                 for src in value:
                     if isinstance(src, dict):
-                        self.console.print(f"    • {src.get('title', 'Untitled')} [dim]({src.get('id', '')})[/dim]")
+                        lines.append(f"    • {src.get('title', 'Untitled')} [dim]({src.get('id', '')})[/dim]")
                     else:
-                        self.console.print(f"    • {src}")
+                        lines.append(f"    • {src}")
+                # One print for the whole list; Rich renders each call separately
+                self.console.print("\n".join(lines))
             else:
                 self.console.print(f"  [cyan]{key}:[/cyan] {value}")
 
@@ -298,7 +299,7 @@ class JsonFormatter(Formatter):
             if full and created:
                 item["created_at"] = created if isinstance(created, str) else created.isoformat()
             data.append(item)
-        print(json.dumps(data, indent=2))
+        print(json_utils.dumps(data))
 
     def format_sources(
         self,
@@ -327,7 +328,7 @@ class JsonFormatter(Formatter):
                 if full:
                     item['is_stale'] = getattr(src, 'is_stale', False)
             data.append(item)
-        print(json.dumps(data, indent=2))
+        print(json_utils.dumps(data))
 
     def format_artifacts(
         self,
@@ -357,7 +358,7 @@ class JsonFormatter(Formatter):
                     item['title'] = getattr(art, 'title', '')
                     item['url'] = getattr(art, 'url', '')
             data.append(item)
-        print(json.dumps(data, indent=2))
+        print(json_utils.dumps(data))
 
     def format_item(self, item: Any, title: str = "") -> None:
         if hasattr(item, "model_dump"):
@@ -366,7 +367,7 @@ class JsonFormatter(Formatter):
             data = {k: v for k, v in item.__dict__.items() if not k.startswith("_")}
         else:
             data = {"value": item}
-        print(json.dumps(data, indent=2))
+        print(json_utils.dumps(data))
 
 
 class CompactFormatter(Formatter):
@@ -422,8 +423,13 @@ class CompactFormatter(Formatter):
             print(str(item))
 
 
+@lru_cache(maxsize=8)
 def get_formatter(format: OutputFormat, console: Console | None = None) -> Formatter:
-    """Get the appropriate formatter for the output format."""
+    """Get the appropriate formatter for the output format.
+
+    Formatters hold no state besides their console, so one instance is
+    reused per (format, console) pair.
+    """
     formatters = {
         OutputFormat.TABLE: TableFormatter,
         OutputFormat.JSON: JsonFormatter,
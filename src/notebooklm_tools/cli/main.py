@@ -1,5 +1,6 @@
 """Main CLI application for NotebookLM Tools."""
 
+import sys
 from typing import Optional
 
 import typer
@@ -60,6 +61,8 @@ app = typer.Typer(
     help="NotebookLM Tools - Unified CLI for Google NotebookLM",
     no_args_is_help=True,
     rich_markup_mode="rich",
+    # Rich tracebacks only help a human at a terminal; logs and pipes get the plain one
+    pretty_exceptions_enable=sys.stderr.isatty(),
 )
 
 # =============================================================================
@@ -313,6 +316,7 @@ def profile_delete(
 ) -> None:
     """Delete a profile and its credentials."""
     from notebooklm_tools.core.auth import AuthManager
+    from notebooklm_tools.cli.utils import confirm_action
 
     auth = AuthManager(profile)
 
@@ -320,11 +324,7 @@ def profile_delete(
         console.print(f"[red]Error:[/red] Profile '{profile}' not found")
         raise typer.Exit(1)
 
-    if not confirm:
-        typer.confirm(
-            f"Are you sure you want to delete profile '{profile}'?",
-            abort=True,
-        )
+    confirm_action(f"Are you sure you want to delete profile '{profile}'?", confirm)
 
     auth.delete_profile()
     console.print(f"[green]✓[/green] Deleted profile: {profile}")
@@ -1,12 +1,34 @@
-from typing import Any
+import atexit
+import functools
+import os
+import re
+import sys
+from collections.abc import Callable, Collection
+from typing import Any, TypeVar
+
 import typer
 from rich.console import Console
+
+from notebooklm_tools.core.alias import get_alias_manager
+from notebooklm_tools.core.auth import AuthManager, load_cached_tokens
 from notebooklm_tools.core.client import NotebookLMClient
-from notebooklm_tools.core.auth import load_cached_tokens, AuthManager
+from notebooklm_tools.core.constants import CodeMapper
+from notebooklm_tools.core.exceptions import NLMError
+from notebooklm_tools.services.errors import ServiceError
 from notebooklm_tools.utils.config import get_config
 
 console = Console()
 
+F = TypeVar("F", bound=Callable[..., Any])
+
+# One ID or alias in a comma-separated list; surrounding whitespace and
+# empty entries are skipped
+_ID_RE = re.compile(r"[^,\s]+")
+
+# Clients shared by every command run in this process, keyed by profile
+_clients: dict[str, NotebookLMClient] = {}
+
+
 def get_client(profile: str | None = None) -> NotebookLMClient:
     """Get an authenticated NotebookLM client.
 
@@ -14,16 +36,33 @@ def get_client(profile: str | None = None) -> NotebookLMClient:
         profile: Optional profile name. Uses config default_profile if not specified.
 
     Tries to load cached tokens first. If unavailable, guides the user to login.
+    One client is kept per profile for the lifetime of the process, so later
+    commands (e.g. in the chat REPL) reuse its connection pool and auth tokens.
+    ``with get_client() as client:`` leaves it open; it is closed at exit.
     """
-    # 1. Try environment variables first (most explicit)
-    import os
     env_cookies = os.environ.get("NOTEBOOKLM_COOKIES")
+    if env_cookies:
+        key = "<env>"
+    else:
+        if not profile:
+            profile = get_config().auth.default_profile
+        key = profile
+
+    client = _clients.get(key)
+    if client is None:
+        client = _create_client(profile, env_cookies)
+        client.close_on_exit = False
+        _clients[key] = client
+    return client
+
+
+def _create_client(profile: str | None, env_cookies: str | None) -> NotebookLMClient:
+    """Build a new client from environment cookies or a saved profile."""
+    # 1. Try environment variables first (most explicit)
     if env_cookies:
         return NotebookLMClient(cookies=extract_cookies_from_string(env_cookies))
 
-    # 2. Try loading specified profile, or fall back to config default
-    if not profile:
-        profile = get_config().auth.default_profile
+    # 2. Try loading the requested profile
     manager = AuthManager(profile)
     if not manager.profile_exists():
         console.print(f"[red]Error:[/red] Profile '{manager.profile_name}' not found. Run 'nlm login' first.")
@@ -42,6 +81,16 @@ def get_client(profile: str | None = None) -> NotebookLMClient:
         console.print("Please run: [bold]nlm login[/bold]")
         raise typer.Exit(1)
 
+
+def reset_clients() -> None:
+    """Close and forget all shared clients."""
+    for client in _clients.values():
+        client.close()
+    _clients.clear()
+
+
+atexit.register(reset_clients)
+
 def handle_error(e: Exception) -> None:
     """Standard error handler for CLI commands."""
     from notebooklm_tools.core.client import NotebookLMError
@@ -58,6 +107,83 @@ def handle_error(e: Exception) -> None:
     
     raise typer.Exit(1)
 
+def cli_error_boundary(func: F) -> F:
+    """Decorator for CLI commands: print NLMError/ServiceError and exit 1.
+
+    NLMError prints its message, ServiceError (including ValidationError)
+    its user_message; both print their hint if set. Apply below
+    ``@app.command(...)`` so Typer registers the wrapped function;
+    ``functools.wraps`` keeps the original signature for option parsing.
+    """
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return func(*args, **kwargs)
+        except NLMError as e:
+            message, hint = e.message, e.hint
+        except ServiceError as e:
+            message, hint = e.user_message, e.hint
+        console.print(f"[red]Error:[/red] {message}")
+        if hint:
+            console.print(f"\n[dim]Hint: {hint}[/dim]")
+        raise typer.Exit(1)
+    return wrapper  # type: ignore[return-value]
+
+def confirm_action(message: str, confirm: bool = False) -> None:
+    """Ask the user to confirm an action unless --confirm was passed.
+
+    Setting NLM_ASSUME_YES in the environment acts like --confirm for every
+    command (for CI and scripts). Otherwise a prompt can't be answered
+    without a terminal on stdin, so fail fast and point at --confirm
+    instead of reading EOF or blocking. Non-TTY is deliberately not
+    treated as consent, since that would make piped deletes silent.
+    """
+    if confirm or os.environ.get("NLM_ASSUME_YES"):
+        return
+    if not sys.stdin.isatty():
+        console.print(
+            "[red]Error:[/red] Confirmation required but stdin is not a terminal. "
+            "Pass --confirm (-y) or set NLM_ASSUME_YES=1 to proceed."
+        )
+        raise typer.Exit(2)
+    typer.confirm(message, abort=True)
+
+def parse_source_ids(source_ids: str | None) -> list[str] | None:
+    """Parse a comma-separated --source-ids value, resolving aliases."""
+    if source_ids:
+        return get_alias_manager().resolve_many(_ID_RE.findall(source_ids))
+    return None
+
+
+def code_choice(mapper: CodeMapper) -> Callable[[str | None], str | None]:
+    """Build an option callback that rejects names unknown to ``mapper``.
+
+    Typos then fail as a usage error while parsing arguments, before a
+    client is created or any request is made.
+    """
+    def check(value: str | None) -> str | None:
+        if value is not None:
+            try:
+                mapper.get_code(value)
+            except ValueError:
+                raise typer.BadParameter(f"'{value}' is not one of: {mapper.options_str}")
+        return value
+    return check
+
+
+def name_choice(names: Collection[str]) -> Callable[[str | None], str | None]:
+    """Build an option callback that rejects values not in ``names``.
+
+    Like :func:`code_choice`, for options backed by a plain set of names.
+    """
+    options = ", ".join(sorted(names))
+
+    def check(value: str | None) -> str | None:
+        if value is not None and value not in names:
+            raise typer.BadParameter(f"'{value}' is not one of: {options}")
+        return value
+    return check
+
 def extract_cookies_from_string(cookie_str: str) -> dict[str, str]:
     """Helper to parse raw cookie string."""
     cookies = {}
@@ -73,7 +199,6 @@ def extract_cookies_from_string(cookie_str: str) -> dict[str, str]:
 # ========== Version Check Utilities ==========
 
 import json
-import os
 import time
 import urllib.request
 from pathlib import Path
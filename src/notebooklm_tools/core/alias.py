@@ -1,11 +1,19 @@
 """Alias management for NotebookLM CLI."""
 
 import json
+import re
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
 from notebooklm_tools.utils.config import get_config_dir
 
+# NotebookLM notebook, source and artifact IDs are lowercase UUIDs; an input
+# of this shape is already canonical and never needs the alias table
+_CANONICAL_ID_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+)
+
 
 class AliasEntry:
     """Represents an alias with its value and type."""
@@ -32,26 +40,33 @@ class AliasManager:
     def __init__(self) -> None:
         self.config_dir = get_config_dir()
         self.aliases_file = self.config_dir / "aliases.json"
-        self._aliases: dict[str, AliasEntry] = {}
-        self._load()
+        self._table: dict[str, AliasEntry] | None = None
+
+    @property
+    def _aliases(self) -> dict[str, AliasEntry]:
+        """The alias table, read from disk on first use."""
+        if self._table is None:
+            self._table = self._load()
+        return self._table
 
-    def _load(self) -> None:
+    def _load(self) -> dict[str, AliasEntry]:
         """Load aliases from disk."""
         if not self.aliases_file.exists():
-            return
+            return {}
         
         try:
             content = self.aliases_file.read_text()
             if content:
                 raw_data = json.loads(content)
                 # Convert to AliasEntry objects (handles legacy format)
-                self._aliases = {
+                return {
                     name: AliasEntry.from_dict(data) 
                     for name, data in raw_data.items()
                 }
         except Exception:
-            # On error, start with empty map
-            self._aliases = {}
+            pass
+        # On error, start with empty map
+        return {}
 
     def _save(self) -> None:
         """Save aliases to disk."""
@@ -91,9 +106,23 @@ class AliasManager:
         If the input matches a known alias, return the aliased value.
         Otherwise return the input as-is.
         """
+        if _CANONICAL_ID_RE.fullmatch(id_or_alias):
+            return id_or_alias
         entry = self._aliases.get(id_or_alias)
         return entry.value if entry else id_or_alias
 
+    def resolve_many(self, ids_or_aliases: Iterable[str]) -> list[str]:
+        """Resolve several IDs or aliases in one pass, preserving order."""
+        is_canonical = _CANONICAL_ID_RE.fullmatch
+        resolved = []
+        for value in ids_or_aliases:
+            if not is_canonical(value):
+                entry = self._aliases.get(value)
+                if entry:
+                    value = entry.value
+            resolved.append(value)
+        return resolved
+
 
 # Global instance
 _alias_manager: AliasManager | None = None
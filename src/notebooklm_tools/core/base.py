@@ -12,11 +12,14 @@ import json
 import logging
 import os
 import re
+import threading
 import urllib.parse
 from typing import Any
 
 import httpx
 
+from notebooklm_tools.utils.json_utils import loads as json_loads
+
 from . import constants
 from .retry import is_retryable_error, DEFAULT_MAX_RETRIES, DEFAULT_BASE_DELAY, DEFAULT_MAX_DELAY
 from .data_types import ConversationTurn
@@ -36,6 +39,14 @@ logger.setLevel(logging.WARNING)  # Suppress internal API logs by default
 DEFAULT_TIMEOUT = 30.0  # Default for most operations
 SOURCE_ADD_TIMEOUT = 120.0  # Extended timeout for all source operations
 
+# Connection pool: keep idle connections long enough to be reused across
+# commands in a long-lived process (REPL, MCP server); httpx default is 5s
+HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=10,
+    max_connections=20,
+    keepalive_expiry=30.0,
+)
+
 
 class BaseClient:
     """Base client providing HTTP/RPC infrastructure for NotebookLM API.
@@ -249,6 +260,20 @@ class BaseClient:
         self._client: httpx.Client | None = None
         self._session_id = session_id
 
+        # Services fan requests out over one client from several threads
+        # (batch delete/create/download, freshness checks). The lock guards
+        # lazy creation of the HTTP client and auth recovery; the generation
+        # is bumped on each recovery so concurrent failures recover only once.
+        self._lock = threading.RLock()
+        self._auth_generation = 0
+        # Clients replaced by auth recovery; other threads may still have
+        # requests in flight on them, so they are closed only in close()
+        self._retired_clients: list[httpx.Client] = []
+
+        # When False, leaving a ``with`` block keeps the HTTP connection pool
+        # open so the client can be shared by several commands in one process
+        self.close_on_exit = True
+
         # Conversation cache for follow-up queries
         # Key: conversation_id, Value: list of ConversationTurn objects
         self._conversation_cache: dict[str, list[ConversationTurn]] = {}
@@ -266,13 +291,18 @@ class BaseClient:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
+        if self.close_on_exit:
+            self.close()
 
     def close(self):
         """Close the underlying HTTP client."""
-        if self._client:
-            self._client.close()
-            self._client = None
+        with self._lock:
+            for retired in self._retired_clients:
+                retired.close()
+            self._retired_clients.clear()
+            if self._client:
+                self._client.close()
+                self._client = None
 
     # =========================================================================
     # Cookie Handling
@@ -325,28 +355,49 @@ class BaseClient:
 
     def _get_client(self) -> httpx.Client:
         """Get or create HTTP client."""
-        if self._client is None:
-            # Use cookies object directly
-            cookies = self._get_httpx_cookies()
-
-            self._client = httpx.Client(
-                cookies=cookies,
-                headers={
-                    "Content-Type": "application/x-www-form-urlencoded;charset=UTF-8",
-                    "Origin": self.BASE_URL,
-                    "Referer": f"{self.BASE_URL}/",
-                    "X-Same-Domain": "1",
-                    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-                },
-                timeout=30.0,
-            )
-            
-            # Explicitly set headers if needed, though constructor handles most
-            if self.csrf_token:
-                self._client.headers["X-Goog-Csrf-Token"] = self.csrf_token
-                
-        return self._client
-    
+        client = self._client
+        if client is not None:
+            return client
+        with self._lock:
+            if self._client is None:
+                self._client = self._new_client()
+            return self._client
+
+    def _new_client(self) -> httpx.Client:
+        """Create the HTTP client for the current cookies and CSRF token."""
+        # Use cookies object directly
+        cookies = self._get_httpx_cookies()
+
+        client = httpx.Client(
+            cookies=cookies,
+            headers={
+                "Content-Type": "application/x-www-form-urlencoded;charset=UTF-8",
+                "Origin": self.BASE_URL,
+                "Referer": f"{self.BASE_URL}/",
+                "X-Same-Domain": "1",
+                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+            },
+            timeout=30.0,
+            limits=HTTP_LIMITS,
+        )
+        
+        # Explicitly set headers if needed, though constructor handles most
+        if self.csrf_token:
+            client.headers["X-Goog-Csrf-Token"] = self.csrf_token
+        return client
+
+    def _reset_client(self) -> None:
+        """Retire the HTTP client after auth recovery; the next call rebuilds it.
+
+        The old client stays open until close(), since other threads may
+        have fetched it before the reset and still be sending on it. Must be
+        called with ``self._lock`` held.
+        """
+        if self._client is not None:
+            self._retired_clients.append(self._client)
+            self._client = None
+        self._auth_generation += 1
+
     def _get_async_client(self) -> httpx.AsyncClient:
         """Get an async client for streaming operations."""
         cookies = self._get_httpx_cookies()
@@ -360,6 +411,7 @@ class BaseClient:
                 "X-Same-Domain": "1",
             },
             timeout=30.0,
+            limits=HTTP_LIMITS,
         )
         if self.csrf_token:
             client.headers["X-Goog-Csrf-Token"] = self.csrf_token
@@ -433,7 +485,7 @@ class BaseClient:
                 if i < len(lines):
                     json_str = lines[i]
                     try:
-                        data = json.loads(json_str)
+                        data = json_loads(json_str)
                         results.append(data)
                     except json.JSONDecodeError:
                         pass
@@ -441,7 +493,7 @@ class BaseClient:
             except ValueError:
                 # Not a byte count, try to parse as JSON
                 try:
-                    data = json.loads(line)
+                    data = json_loads(line)
                     results.append(data)
                 except json.JSONDecodeError:
                     pass
@@ -464,7 +516,7 @@ class BaseClient:
                             result_str = item[2]
                             if isinstance(result_str, str):
                                 try:
-                                    return json.loads(result_str)
+                                    return json_loads(result_str)
                                 except json.JSONDecodeError:
                                     return result_str
                             return result_str
@@ -488,6 +540,7 @@ class BaseClient:
         3. Run headless auth (auto-refresh if Chrome profile has saved login)
         """
         client = self._get_client()
+        generation = self._auth_generation
         body = self._build_request_body(rpc_id, params)
         url = self._build_url(rpc_id, path)
 
@@ -580,11 +633,17 @@ class BaseClient:
 
         # -- Auth recovery (reached only for 401/403 HTTP or RPC Error 16) --
 
+        # Recovery runs under the lock. If another thread already recovered
+        # since this request was sent (generation changed), just retry with
+        # the new tokens instead of refreshing again.
+
         # Layer 1: Refresh CSRF/session tokens (first retry only)
         if not _retry:
             try:
-                self._refresh_auth_tokens()
-                self._client = None
+                with self._lock:
+                    if self._auth_generation == generation:
+                        self._refresh_auth_tokens()
+                        self._reset_client()
                 return self._call_rpc(rpc_id, params, path, timeout, _retry=True)
             except ValueError:
                 # CSRF refresh failed (cookies expired) - continue to layer 2
@@ -592,8 +651,12 @@ class BaseClient:
         
         # Layer 2 & 3: Reload from disk or run headless auth (deep retry)
         if not _deep_retry:
-            if self._try_reload_or_headless_auth():
-                self._client = None
+            with self._lock:
+                recovered = self._auth_generation != generation
+                if not recovered and self._try_reload_or_headless_auth():
+                    self._reset_client()
+                    recovered = True
+            if recovered:
                 return self._call_rpc(rpc_id, params, path, timeout, _retry=True, _deep_retry=True)
         
         # All recovery attempts failed
@@ -166,6 +166,4 @@ class NotebookLMClient(ExportMixin, DownloadMixin, StudioMixin, ResearchMixin, C
 
     def close(self) -> None:
         """Close the HTTP client."""
-        if self._client:
-            self._client.close()
-            self._client = None
+        super().close()
@@ -43,8 +43,11 @@ class CodeMapper:
         """
         if not name:
             raise ValueError(f"Invalid name: '{name}'. Must be one of: {self.options_str}")
-            
-        code = self._name_to_code.get(name.lower())
+
+        # Fast path: CLI defaults and most user input are already lower-case
+        code = self._name_to_code.get(name)
+        if code is None:
+            code = self._name_to_code.get(name.lower())
         if code is None:
             raise ValueError(f"Unknown name '{name}'. Must be one of: {self.options_str}")
         return code
@@ -27,6 +27,28 @@ from .exceptions import FileUploadError, FileValidationError
 from .retry import execute_with_retry
 
 
+def _url_source_data(url: str) -> list:
+    """Build the add-source payload entry for a website or YouTube URL."""
+    # URL position differs for YouTube vs regular websites:
+    # - YouTube: position 7
+    # - Regular websites: position 2
+    is_youtube = "youtube.com" in url.lower() or "youtu.be" in url.lower()
+
+    if is_youtube:
+        # YouTube: [null, null, null, null, null, null, null, [url], null, null, 1]
+        return [None, None, None, None, None, None, None, [url], None, None, 1]
+    # Regular website: [null, null, [url], null, null, null, null, null, null, null, 1]
+    return [None, None, [url], None, None, None, None, None, None, None, 1]
+
+
+def _drive_source_data(document_id: str, mime_type: str, title: str) -> list:
+    """Build the add-source payload entry for a Google Drive document."""
+    return [
+        [document_id, mime_type, 1, title],
+        None, None, None, None, None, None, None, None, None, 1
+    ]
+
+
 class SourceMixin(BaseClient):
     """Mixin for source management operations.
     
@@ -259,17 +281,7 @@ class SourceMixin(BaseClient):
         """
         client = self._get_client()
 
-        # URL position differs for YouTube vs regular websites:
-        # - YouTube: position 7
-        # - Regular websites: position 2
-        is_youtube = "youtube.com" in url.lower() or "youtu.be" in url.lower()
-
-        if is_youtube:
-            # YouTube: [null, null, null, null, null, null, null, [url], null, null, 1]
-            source_data = [None, None, None, None, None, None, None, [url], None, None, 1]
-        else:
-            # Regular website: [null, null, [url], null, null, null, null, null, null, null, 1]
-            source_data = [None, None, [url], None, None, None, None, None, None, None, 1]
+        source_data = _url_source_data(url)
 
         params = [
             [source_data],
@@ -393,10 +405,7 @@ class SourceMixin(BaseClient):
         """
         client = self._get_client()
 
-        source_data = [
-            [document_id, mime_type, 1, title],
-            None, None, None, None, None, None, None, None, None, 1
-        ]
+        source_data = _drive_source_data(document_id, mime_type, title)
         params = [
             [source_data],
             notebook_id,
@@ -437,6 +446,66 @@ class SourceMixin(BaseClient):
         return source_result
 
 
+    def add_sources_batch(
+        self,
+        notebook_id: str,
+        urls: list[str] | None = None,
+        drive_documents: list[tuple[str, str, str]] | None = None,
+    ) -> list[dict]:
+        """Add several URL and Drive sources in a single request.
+
+        The add-source RPC takes a list of source entries, so a whole batch
+        costs one round trip instead of one per source.
+
+        Args:
+            notebook_id: Target notebook ID
+            urls: URLs to add (websites or YouTube)
+            drive_documents: (document_id, mime_type, title) tuples
+
+        Returns:
+            Source dicts with id and title, in the order they were returned
+        """
+        client = self._get_client()
+
+        source_data = [_url_source_data(url) for url in urls or []]
+        source_data += [
+            _drive_source_data(doc_id, mime_type, title)
+            for doc_id, mime_type, title in drive_documents or []
+        ]
+        if not source_data:
+            return []
+
+        params = [
+            source_data,
+            notebook_id,
+            [2],
+            [1, None, None, None, None, None, None, None, None, None, [1]]
+        ]
+        body = self._build_request_body(self.RPC_ADD_SOURCE, params)
+        source_path = f"/notebook/{notebook_id}"
+        url_endpoint = self._build_url(self.RPC_ADD_SOURCE, source_path)
+
+        def _do_request():
+            resp = client.post(url_endpoint, content=body, timeout=SOURCE_ADD_TIMEOUT)
+            resp.raise_for_status()
+            return resp
+        response = execute_with_retry(_do_request)
+
+        parsed = self._parse_response(response.text)
+        result = self._extract_rpc_result(parsed, self.RPC_ADD_SOURCE)
+
+        sources = []
+        if result and isinstance(result, list) and result[0]:
+            for entry in result[0]:
+                if not entry or not entry[0]:
+                    continue
+                sources.append({
+                    "id": entry[0][0],
+                    "title": entry[1] if len(entry) > 1 else "Untitled",
+                })
+        return sources
+
+
     def _register_file_source(self, notebook_id: str, filename: str) -> str:
         """Register a file source intent and get SOURCE_ID.
 
@@ -6,6 +6,14 @@ from ._utils import get_client, logged_tool
 from ...services import studio as studio_service, ServiceError, ValidationError
 
 
+def _service_error(e: ServiceError) -> dict[str, Any]:
+    """Error response for a ServiceError, including its hint if any."""
+    response = {"status": "error", "error": e.user_message}
+    if e.hint:
+        response["hint"] = e.hint
+    return response
+
+
 @logged_tool()
 def studio_create(
     notebook_id: str,
@@ -135,8 +143,8 @@ def studio_create(
             "notebook_url": f"https://notebooklm.google.com/notebook/{notebook_id}",
             **result,
         }
-    except (ValidationError, ServiceError) as e:
-        return {"status": "error", "error": e.user_message if isinstance(e, ServiceError) else str(e)}
+    except ServiceError as e:
+        return _service_error(e)
     except Exception as e:
         return {"status": "error", "error": str(e)}
 
@@ -195,8 +203,8 @@ def studio_status(
             "artifacts": result["artifacts"],
             "notebook_url": f"https://notebooklm.google.com/notebook/{notebook_id}",
         }
-    except (ValidationError, ServiceError) as e:
-        return {"status": "error", "error": e.user_message if isinstance(e, ServiceError) else str(e)}
+    except ServiceError as e:
+        return _service_error(e)
     except Exception as e:
         return {"status": "error", "error": str(e)}
 
@@ -231,6 +239,6 @@ def studio_delete(
             "notebook_id": notebook_id,
         }
     except ServiceError as e:
-        return {"status": "error", "error": e.user_message}
+        return _service_error(e)
     except Exception as e:
         return {"status": "error", "error": str(e)}
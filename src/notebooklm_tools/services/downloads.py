@@ -1,5 +1,8 @@
 """Downloads service — shared validation and routing for artifact downloads."""
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import TypedDict, Optional, Callable, Any
 
 from ..core.client import NotebookLMClient
@@ -31,6 +34,9 @@ DEFAULT_EXTENSIONS = {
     "flashcards": "json",  # varies by format
 }
 
+# Upper bound on concurrent transfers in download_artifacts
+MAX_PARALLEL_DOWNLOADS = 4
+
 # Extension map for output formats (quiz/flashcards)
 FORMAT_EXTENSIONS = {
     "json": "json",
@@ -45,6 +51,12 @@ class DownloadResult(TypedDict):
     path: str
 
 
+class BatchDownloadResult(TypedDict):
+    """Result of downloading several artifacts."""
+    downloaded: list[DownloadResult]
+    failed: dict[str, str]
+
+
 def validate_artifact_type(artifact_type: str) -> None:
     """Validate artifact type. Raises ValidationError if invalid."""
     if artifact_type not in VALID_ARTIFACT_TYPES:
@@ -248,3 +260,56 @@ async def _dispatch_async(
         raise ValidationError(
             f"Artifact type '{artifact_type}' is not supported for async download.",
         )
+
+
+def download_artifacts(
+    client: NotebookLMClient,
+    notebook_id: str,
+    artifacts: list[dict],
+    output_dir: str,
+) -> BatchDownloadResult:
+    """Download several artifacts concurrently into one directory.
+
+    Each transfer is independent, so they run in a small thread pool on the
+    shared client (streaming types get their own event loop per worker). A
+    failure for one artifact does not stop the others.
+
+    Args:
+        client: Authenticated NotebookLM client
+        notebook_id: Notebook UUID
+        artifacts: Dicts with "artifact_id" and "type", as listed by studio status
+        output_dir: Directory for the files, named {type}_{id prefix}.{ext}
+
+    Returns:
+        BatchDownloadResult with downloads (input order) and a map of
+        failed artifact IDs to user-facing error messages
+    """
+    for artifact in artifacts:
+        validate_artifact_type(artifact["type"])
+    if not artifacts:
+        return BatchDownloadResult(downloaded=[], failed={})
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    def _download_one(artifact: dict) -> DownloadResult | str:
+        artifact_type, artifact_id = artifact["type"], artifact["artifact_id"]
+        ext = get_default_extension(artifact_type)
+        path = os.path.join(output_dir, f"{artifact_type}_{artifact_id[:8]}.{ext}")
+        try:
+            if artifact_type in STREAMING_TYPES or artifact_type in INTERACTIVE_TYPES:
+                return asyncio.run(download_async(
+                    client, notebook_id, artifact_type, path, artifact_id=artifact_id,
+                ))
+            return download_sync(client, notebook_id, artifact_type, path, artifact_id=artifact_id)
+        except ServiceError as e:
+            return e.user_message
+
+    workers = min(MAX_PARALLEL_DOWNLOADS, len(artifacts))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        outcomes = list(pool.map(_download_one, artifacts))
+
+    downloaded = [o for o in outcomes if not isinstance(o, str)]
+    failed = {
+        a["artifact_id"]: o for a, o in zip(artifacts, outcomes, strict=True) if isinstance(o, str)
+    }
+    return BatchDownloadResult(downloaded=downloaded, failed=failed)
@@ -1,11 +1,22 @@
 """Service layer errors and exceptions."""
 
 class ServiceError(Exception):
-    """Base class for all service layer errors."""
-    def __init__(self, message: str, user_message: str = None, debug_code: str = None):
+    """Base class for all service layer errors.
+
+    ``hint`` is an optional next step for the user, shown separately from
+    ``user_message`` (mirrors NLMError.hint).
+    """
+    def __init__(
+        self,
+        message: str,
+        user_message: str = None,
+        debug_code: str = None,
+        hint: str = None,
+    ):
         super().__init__(message)
         self.user_message = user_message or message
         self.debug_code = debug_code
+        self.hint = hint
 
 class ValidationError(ServiceError):
     """Raised when input parameters are invalid."""
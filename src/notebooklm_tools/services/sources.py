@@ -1,5 +1,6 @@
 """Sources service — shared validation and logic for source management."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import TypedDict, Optional
 
 from ..core.client import NotebookLMClient
@@ -8,6 +9,9 @@ from .errors import ValidationError, ServiceError
 VALID_SOURCE_TYPES = ("url", "text", "drive", "file")
 VALID_DRIVE_DOC_TYPES = ("doc", "slides", "sheets", "pdf")
 
+# Upper bound on concurrent per-source Drive requests (freshness, sync)
+MAX_PARALLEL_DRIVE_CALLS = 8
+
 # MIME type mapping for Drive doc types
 DRIVE_MIME_TYPES = {
     "doc": "application/vnd.google-apps.document",
@@ -166,6 +170,62 @@ def add_source(
     raise ServiceError(f"Unexpected source type: {source_type}")
 
 
+def add_sources_batch(
+    client: NotebookLMClient,
+    notebook_id: str,
+    *,
+    urls: Optional[list[str]] = None,
+    document_ids: Optional[list[str]] = None,
+    doc_type: str = "doc",
+) -> list[AddSourceResult]:
+    """Add many URL and Drive sources to a notebook in one request.
+
+    Args:
+        client: Authenticated NotebookLM client
+        notebook_id: Notebook UUID
+        urls: URLs to add
+        document_ids: Drive document IDs to add
+        doc_type: Drive doc type for every document: doc|slides|sheets|pdf
+
+    Returns:
+        One AddSourceResult per source the backend created
+
+    Raises:
+        ValidationError: If there is nothing to add
+        ServiceError: If the add operation fails
+    """
+    urls = urls or []
+    document_ids = document_ids or []
+    if not urls and not document_ids:
+        raise ValidationError("At least one URL or Drive document ID is required.")
+
+    mime_type = resolve_drive_mime_type(doc_type)
+    drive_documents = [(doc_id, mime_type, "Drive Document") for doc_id in document_ids]
+    try:
+        results = client.add_sources_batch(
+            notebook_id, urls=urls, drive_documents=drive_documents,
+        )
+    except Exception as e:
+        raise ServiceError(
+            f"Failed to add {len(urls) + len(document_ids)} sources: {e}",
+            user_message="Could not add sources. Some may have been added; check 'nlm source list'.",
+        )
+
+    if not results:
+        raise ServiceError(
+            "Failed to add sources — no IDs returned",
+            user_message="Failed to add sources.",
+        )
+    # The backend answers in request order; only trust that if nothing was dropped
+    types = ["url"] * len(urls) + ["drive"] * len(document_ids)
+    if len(results) != len(types):
+        types = ["unknown"] * len(results)
+    return [
+        {"source_type": t, "source_id": r["id"], "title": r["title"]}
+        for t, r in zip(types, results, strict=True)
+    ]
+
+
 def _extract_result(
     result: Optional[dict], source_type: str, fallback_title: str,
 ) -> AddSourceResult:
@@ -182,6 +242,25 @@ def _extract_result(
     }
 
 
+def check_sources_freshness(
+    client: NotebookLMClient,
+    source_ids: list[str],
+) -> dict[str, Optional[bool]]:
+    """Check Drive freshness for several sources concurrently.
+
+    Each check is its own RPC, so they run through a small thread pool on
+    the shared client instead of one round trip after another.
+
+    Returns:
+        source_id -> True (fresh), False (stale) or None (unknown)
+    """
+    if not source_ids:
+        return {}
+    workers = min(MAX_PARALLEL_DRIVE_CALLS, len(source_ids))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return dict(zip(source_ids, pool.map(client.check_source_freshness, source_ids), strict=True))
+
+
 def list_drive_sources(
     client: NotebookLMClient,
     notebook_id: str,
@@ -208,6 +287,9 @@ def list_drive_sources(
 
     drive_sources: list[DriveSourceInfo] = []
     other_sources: list[dict] = []
+    freshness = check_sources_freshness(
+        client, [s["id"] for s in sources if s.get("can_sync")],
+    )
 
     for source in sources:
         source_info: dict = {
@@ -217,7 +299,7 @@ def list_drive_sources(
         }
 
         if source.get("can_sync"):
-            is_fresh = client.check_source_freshness(source["id"])
+            is_fresh = freshness[source["id"]]
             source_info["stale"] = not is_fresh if is_fresh is not None else None
             source_info["drive_doc_id"] = source.get("drive_doc_id")
             drive_sources.append(source_info)
@@ -251,15 +333,17 @@ def sync_drive_sources(
     if not source_ids:
         raise ValidationError("No source IDs provided for sync.")
 
-    results: list[SyncResult] = []
-    for source_id in source_ids:
+    def _sync_one(source_id: str) -> SyncResult:
         try:
             result = client.sync_drive_source(source_id)
-            results.append({"source_id": source_id, "synced": bool(result), "error": None})
+            return {"source_id": source_id, "synced": bool(result), "error": None}
         except Exception as e:
-            results.append({"source_id": source_id, "synced": False, "error": str(e)})
+            return {"source_id": source_id, "synced": False, "error": str(e)}
 
-    return results
+    # Syncs are independent RPCs; run them concurrently, results in input order
+    workers = min(MAX_PARALLEL_DRIVE_CALLS, len(source_ids))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_sync_one, source_ids))
 
 
 def delete_source(
@@ -11,6 +11,8 @@ Centralizes:
 from __future__ import annotations
 
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Optional, TypedDict
 
 from notebooklm_tools.core import constants
@@ -26,6 +28,45 @@ VALID_ARTIFACT_TYPES = frozenset([
     "flashcards", "quiz", "data_table", "mind_map",
 ])
 
+# Code-mapped options per artifact type: (kwarg name, mapper, error label)
+_CODE_OPTIONS: dict[str, tuple[tuple[str, constants.CodeMapper, str], ...]] = {
+    "audio": (
+        ("audio_format", constants.AUDIO_FORMATS, "audio format"),
+        ("audio_length", constants.AUDIO_LENGTHS, "audio length"),
+    ),
+    "video": (
+        ("video_format", constants.VIDEO_FORMATS, "video format"),
+        ("visual_style", constants.VIDEO_STYLES, "visual style"),
+    ),
+    "infographic": (
+        ("orientation", constants.INFOGRAPHIC_ORIENTATIONS, "orientation"),
+        ("detail_level", constants.INFOGRAPHIC_DETAILS, "detail level"),
+    ),
+    "slide_deck": (
+        ("slide_format", constants.SLIDE_DECK_FORMATS, "slide format"),
+        ("slide_length", constants.SLIDE_DECK_LENGTHS, "slide length"),
+    ),
+    "flashcards": (
+        ("difficulty", constants.FLASHCARD_DIFFICULTIES, "difficulty"),
+    ),
+    "quiz": (
+        ("difficulty", constants.FLASHCARD_DIFFICULTIES, "difficulty"),
+    ),
+}
+
+# Upper bound on concurrent delete requests in delete_artifacts
+MAX_PARALLEL_DELETES = 8
+
+# Seconds to refuse repeating a create request the backend just rejected
+# (it returns no artifact_id, e.g. quota or policy)
+REJECTION_COOLDOWN_SECONDS = 60.0
+
+REJECTION_HINT = "Try again later or create from NotebookLM UI for diagnosis."
+
+# (notebook_id, artifact_type, *request options) -> time.monotonic() of the
+# last rejection; a retry with different sources or options is not held back
+_recent_rejections: dict[tuple, float] = {}
+
 
 # ---------- TypedDicts ----------
 
@@ -71,6 +112,18 @@ class RenameResult(TypedDict):
     new_title: str
 
 
+class BatchCreateResult(TypedDict):
+    """Result of creating several artifacts (failed is keyed by spec index)."""
+    created: list[CreateResult | MindMapResult]
+    failed: dict[int, str]
+
+
+class BatchDeleteResult(TypedDict):
+    """Result of deleting several artifacts."""
+    deleted: list[str]
+    failed: dict[str, str]
+
+
 # ---------- Validation ----------
 
 def validate_artifact_type(artifact_type: str) -> None:
@@ -108,6 +161,52 @@ def resolve_code(mapper: constants.CodeMapper, name: str, label: str) -> int:
         )
 
 
+def validate_create_args(artifact_type: str, **kwargs) -> dict[str, int]:
+    """Check create_artifact arguments without touching the network.
+
+    Validates the artifact type, resolves every code-mapped option present
+    in kwargs, and checks required fields, so callers can reject bad input
+    before opening a client or prompting for confirmation.
+
+    Returns:
+        Resolved integer codes keyed by kwarg name (e.g. {"audio_format": 1})
+
+    Raises:
+        ValidationError: Invalid artifact type, option name, or missing field
+    """
+    validate_artifact_type(artifact_type)
+    codes = {
+        key: resolve_code(mapper, kwargs[key], label)
+        for key, mapper, label in _CODE_OPTIONS.get(artifact_type, ())
+        if key in kwargs
+    }
+    if artifact_type == "data_table" and not kwargs.get("description"):
+        raise ValidationError("description is required for data_table")
+    return codes
+
+
+def _check_recent_rejection(key: tuple) -> None:
+    """Fail fast if this exact create request was just rejected.
+
+    Raises:
+        ServiceError: If a rejection was recorded within the cooldown window
+    """
+    rejected_at = _recent_rejections.get(key)
+    if rejected_at is None:
+        return
+    elapsed = time.monotonic() - rejected_at
+    if elapsed >= REJECTION_COOLDOWN_SECONDS:
+        # pop, not del: another thread may have expired it already
+        _recent_rejections.pop(key, None)
+        return
+    label = key[1].replace('_', ' ')
+    wait = int(REJECTION_COOLDOWN_SECONDS - elapsed) + 1
+    raise ServiceError(
+        f"NotebookLM rejected {label} creation {int(elapsed)}s ago; not retrying yet.",
+        user_message=f"NotebookLM rejected {label} creation recently. Try again in {wait}s.",
+    )
+
+
 def _resolve_source_ids(
     client: "NotebookLMClient",
     notebook_id: str,
@@ -149,10 +248,8 @@ def _validate_result(result: dict | None, artifact_type: str) -> str:
     if not result or not result.get("artifact_id"):
         raise ServiceError(
             f"NotebookLM rejected {artifact_type.replace('_', ' ')} creation — no artifact returned.",
-            user_message=(
-                f"NotebookLM rejected {artifact_type.replace('_', ' ')} creation. "
-                f"Try again later or create from NotebookLM UI for diagnosis."
-            ),
+            user_message=f"NotebookLM rejected {artifact_type.replace('_', ' ')} creation.",
+            hint=REJECTION_HINT,
         )
     return result["artifact_id"]
 
@@ -203,7 +300,21 @@ def create_artifact(
         ValidationError: Invalid artifact type, format, or missing required fields
         ServiceError: API call failures
     """
-    validate_artifact_type(artifact_type)
+    codes = validate_create_args(
+        artifact_type,
+        audio_format=audio_format, audio_length=audio_length,
+        video_format=video_format, visual_style=visual_style,
+        orientation=orientation, detail_level=detail_level,
+        slide_format=slide_format, slide_length=slide_length,
+        difficulty=difficulty, description=description,
+    )
+    rejection_key = (
+        notebook_id, artifact_type,
+        tuple(source_ids or ()), tuple(sorted(codes.items())),
+        report_format, custom_prompt, question_count,
+        language, focus_prompt, title, description,
+    )
+    _check_recent_rejection(rejection_key)
     resolved_ids = _resolve_source_ids(client, notebook_id, source_ids)
 
     try:
@@ -211,18 +322,18 @@ def create_artifact(
             return _create_mind_map(client, notebook_id, resolved_ids, title)
 
         result = _dispatch_create(
-            client, notebook_id, artifact_type, resolved_ids,
-            audio_format=audio_format, audio_length=audio_length,
-            video_format=video_format, visual_style=visual_style,
-            orientation=orientation, detail_level=detail_level,
-            slide_format=slide_format, slide_length=slide_length,
+            client, notebook_id, artifact_type, resolved_ids, codes,
             report_format=report_format, custom_prompt=custom_prompt,
-            question_count=question_count, difficulty=difficulty,
+            question_count=question_count,
             language=language, focus_prompt=focus_prompt,
             description=description,
         )
 
-        artifact_id = _validate_result(result, artifact_type)
+        try:
+            artifact_id = _validate_result(result, artifact_type)
+        except ServiceError:
+            _recent_rejections[rejection_key] = time.monotonic()
+            raise
         return CreateResult(
             artifact_type=artifact_type,
             artifact_id=artifact_id,
@@ -239,86 +350,123 @@ def create_artifact(
         )
 
 
-def _dispatch_create(
-    client: "NotebookLMClient",
-    notebook_id: str,
-    artifact_type: str,
-    source_ids: list[str],
-    **kwargs,
+def _create_audio(
+    client: "NotebookLMClient", notebook_id: str, source_ids: list[str],
+    codes: dict[str, int], kw: dict,
 ) -> dict | None:
-    """Dispatch to the appropriate client method based on artifact_type."""
-
-    if artifact_type == "audio":
-        format_code = resolve_code(constants.AUDIO_FORMATS, kwargs["audio_format"], "audio format")
-        length_code = resolve_code(constants.AUDIO_LENGTHS, kwargs["audio_length"], "audio length")
-        return client.create_audio_overview(
-            notebook_id, source_ids=source_ids,
-            format_code=format_code, length_code=length_code,
-            language=kwargs["language"], focus_prompt=kwargs["focus_prompt"],
-        )
+    return client.create_audio_overview(
+        notebook_id, source_ids=source_ids,
+        format_code=codes["audio_format"], length_code=codes["audio_length"],
+        language=kw["language"], focus_prompt=kw["focus_prompt"],
+    )
 
-    elif artifact_type == "video":
-        format_code = resolve_code(constants.VIDEO_FORMATS, kwargs["video_format"], "video format")
-        style_code = resolve_code(constants.VIDEO_STYLES, kwargs["visual_style"], "visual style")
-        return client.create_video_overview(
-            notebook_id, source_ids=source_ids,
-            format_code=format_code, visual_style_code=style_code,
-            language=kwargs["language"], focus_prompt=kwargs["focus_prompt"],
-        )
 
-    elif artifact_type == "infographic":
-        orientation_code = resolve_code(constants.INFOGRAPHIC_ORIENTATIONS, kwargs["orientation"], "orientation")
-        detail_code = resolve_code(constants.INFOGRAPHIC_DETAILS, kwargs["detail_level"], "detail level")
-        return client.create_infographic(
-            notebook_id, source_ids=source_ids,
-            orientation_code=orientation_code, detail_level_code=detail_code,
-            language=kwargs["language"], focus_prompt=kwargs["focus_prompt"],
-        )
+def _create_video(
+    client: "NotebookLMClient", notebook_id: str, source_ids: list[str],
+    codes: dict[str, int], kw: dict,
+) -> dict | None:
+    return client.create_video_overview(
+        notebook_id, source_ids=source_ids,
+        format_code=codes["video_format"], visual_style_code=codes["visual_style"],
+        language=kw["language"], focus_prompt=kw["focus_prompt"],
+    )
 
-    elif artifact_type == "slide_deck":
-        format_code = resolve_code(constants.SLIDE_DECK_FORMATS, kwargs["slide_format"], "slide format")
-        length_code = resolve_code(constants.SLIDE_DECK_LENGTHS, kwargs["slide_length"], "slide length")
-        return client.create_slide_deck(
-            notebook_id, source_ids=source_ids,
-            format_code=format_code, length_code=length_code,
-            language=kwargs["language"], focus_prompt=kwargs["focus_prompt"],
-        )
 
-    elif artifact_type == "report":
-        return client.create_report(
-            notebook_id, source_ids=source_ids,
-            report_format=kwargs["report_format"],
-            custom_prompt=kwargs["custom_prompt"],
-            language=kwargs["language"],
-        )
+def _create_infographic(
+    client: "NotebookLMClient", notebook_id: str, source_ids: list[str],
+    codes: dict[str, int], kw: dict,
+) -> dict | None:
+    return client.create_infographic(
+        notebook_id, source_ids=source_ids,
+        orientation_code=codes["orientation"], detail_level_code=codes["detail_level"],
+        language=kw["language"], focus_prompt=kw["focus_prompt"],
+    )
 
-    elif artifact_type == "flashcards":
-        difficulty_code = resolve_code(constants.FLASHCARD_DIFFICULTIES, kwargs["difficulty"], "difficulty")
-        return client.create_flashcards(
-            notebook_id, source_ids=source_ids,
-            difficulty_code=difficulty_code,
-            focus_prompt=kwargs["focus_prompt"],
-        )
 
-    elif artifact_type == "quiz":
-        difficulty_code = resolve_code(constants.FLASHCARD_DIFFICULTIES, kwargs["difficulty"], "difficulty")
-        return client.create_quiz(
-            notebook_id, source_ids=source_ids,
-            question_count=kwargs["question_count"],
-            difficulty=difficulty_code,
-            focus_prompt=kwargs["focus_prompt"],
-        )
+def _create_slide_deck(
+    client: "NotebookLMClient", notebook_id: str, source_ids: list[str],
+    codes: dict[str, int], kw: dict,
+) -> dict | None:
+    return client.create_slide_deck(
+        notebook_id, source_ids=source_ids,
+        format_code=codes["slide_format"], length_code=codes["slide_length"],
+        language=kw["language"], focus_prompt=kw["focus_prompt"],
+    )
 
-    elif artifact_type == "data_table":
-        if not kwargs["description"]:
-            raise ValidationError("description is required for data_table")
-        return client.create_data_table(
-            notebook_id, source_ids=source_ids,
-            description=kwargs["description"],
-            language=kwargs["language"],
-        )
 
-    return None  # unreachable after validate_artifact_type
+def _create_report(
+    client: "NotebookLMClient", notebook_id: str, source_ids: list[str],
+    codes: dict[str, int], kw: dict,
+) -> dict | None:
+    return client.create_report(
+        notebook_id, source_ids=source_ids,
+        report_format=kw["report_format"],
+        custom_prompt=kw["custom_prompt"],
+        language=kw["language"],
+    )
+
+
+def _create_flashcards(
+    client: "NotebookLMClient", notebook_id: str, source_ids: list[str],
+    codes: dict[str, int], kw: dict,
+) -> dict | None:
+    return client.create_flashcards(
+        notebook_id, source_ids=source_ids,
+        difficulty_code=codes["difficulty"],
+        focus_prompt=kw["focus_prompt"],
+    )
+
+
+def _create_quiz(
+    client: "NotebookLMClient", notebook_id: str, source_ids: list[str],
+    codes: dict[str, int], kw: dict,
+) -> dict | None:
+    return client.create_quiz(
+        notebook_id, source_ids=source_ids,
+        question_count=kw["question_count"],
+        difficulty=codes["difficulty"],
+        focus_prompt=kw["focus_prompt"],
+    )
+
+
+def _create_data_table(
+    client: "NotebookLMClient", notebook_id: str, source_ids: list[str],
+    codes: dict[str, int], kw: dict,
+) -> dict | None:
+    return client.create_data_table(
+        notebook_id, source_ids=source_ids,
+        description=kw["description"],
+        language=kw["language"],
+    )
+
+
+# artifact_type -> creator(client, notebook_id, source_ids, codes, kwargs).
+# Mind maps are handled separately (two-step generate → save).
+_CREATORS = {
+    "audio": _create_audio,
+    "video": _create_video,
+    "infographic": _create_infographic,
+    "slide_deck": _create_slide_deck,
+    "report": _create_report,
+    "flashcards": _create_flashcards,
+    "quiz": _create_quiz,
+    "data_table": _create_data_table,
+}
+
+
+def _dispatch_create(
+    client: "NotebookLMClient",
+    notebook_id: str,
+    artifact_type: str,
+    source_ids: list[str],
+    codes: dict[str, int],
+    **kwargs,
+) -> dict | None:
+    """Dispatch to the appropriate client method based on artifact_type.
+
+    ``codes`` holds the option codes already resolved by validate_create_args.
+    """
+    return _CREATORS[artifact_type](client, notebook_id, source_ids, codes, kwargs)
 
 
 def _create_mind_map(
@@ -329,6 +477,10 @@ def _create_mind_map(
 ) -> MindMapResult:
     """Two-step mind map creation: generate → save.
 
+    The save request carries the generated JSON, so the steps cannot run
+    concurrently. Both go through the client's shared ``httpx.Client``,
+    so the save reuses the connection opened for generation.
+
     Raises:
         ServiceError: If generation or save fails
     """
@@ -372,6 +524,122 @@ def _create_mind_map(
     )
 
 
+# Keyword options accepted by create_artifact (and so by batch specs),
+# mapped to the type a spec value must have. source_ids is checked apart.
+# Keep in sync with the create_artifact signature.
+_CREATE_OPTIONS: dict[str, type] = {
+    "audio_format": str,
+    "audio_length": str,
+    "video_format": str,
+    "visual_style": str,
+    "orientation": str,
+    "detail_level": str,
+    "slide_format": str,
+    "slide_length": str,
+    "report_format": str,
+    "custom_prompt": str,
+    "question_count": int,
+    "difficulty": str,
+    "language": str,
+    "focus_prompt": str,
+    "title": str,
+    "description": str,
+}
+_TYPE_NAMES = {str: "a string", int: "an integer"}
+
+
+def _check_spec_option(key: str, value: object) -> Optional[str]:
+    """Return why a batch spec option value has the wrong type, if it does."""
+    if key == "source_ids":
+        if value is None or isinstance(value, str):
+            return None
+        if isinstance(value, list) and all(isinstance(i, str) for i in value):
+            return None
+        return "source_ids must be a list or comma-separated string"
+    expected = _CREATE_OPTIONS[key]
+    # type() rather than isinstance(): JSON true/false must not pass as int
+    if type(value) is not expected:
+        return f"{key} must be {_TYPE_NAMES[expected]}"
+    return None
+
+
+def validate_artifact_specs(specs: list[dict]) -> list[tuple[str, dict]]:
+    """Validate batch creation specs without touching the network.
+
+    Each spec is a dict with a "type" key plus create_artifact options,
+    e.g. {"type": "audio", "audio_format": "brief"}. source_ids may be a
+    list or a comma-separated string; it is returned as a list.
+
+    Returns:
+        (artifact_type, options) pairs, in spec order
+
+    Raises:
+        ValidationError: If the list is empty or any spec is invalid
+    """
+    if not specs:
+        raise ValidationError("At least one artifact spec is required")
+
+    prepared = []
+    for index, spec in enumerate(specs):
+        if not isinstance(spec, dict) or not spec.get("type"):
+            raise ValidationError(f"Spec #{index + 1} must be an object with a 'type'")
+        options = {k: v for k, v in spec.items() if k != "type"}
+        unknown = sorted(set(options) - _CREATE_OPTIONS.keys() - {"source_ids"})
+        if unknown:
+            raise ValidationError(
+                f"Spec #{index + 1}: unknown option(s) {', '.join(unknown)}",
+            )
+        for key, value in options.items():
+            problem = _check_spec_option(key, value)
+            if problem:
+                raise ValidationError(f"Spec #{index + 1}: {problem}")
+        if isinstance(options.get("source_ids"), str):
+            options["source_ids"] = [
+                part.strip() for part in options["source_ids"].split(",") if part.strip()
+            ]
+        try:
+            validate_create_args(spec["type"], **options)
+        except ValidationError as e:
+            raise ValidationError(f"Spec #{index + 1}: {e}") from e
+        prepared.append((spec["type"], options))
+    return prepared
+
+
+def create_artifacts(
+    client: "NotebookLMClient",
+    notebook_id: str,
+    specs: list[dict],
+) -> BatchCreateResult:
+    """Create several studio artifacts, submitting them one at a time.
+
+    All specs are validated before any request is sent (see
+    validate_artifact_specs), and the notebook's sources are fetched at
+    most once for specs that don't name their own source_ids. Submits are
+    sequential: concurrent generation requests on one notebook are prone
+    to being rejected by the backend.
+
+    Raises:
+        ValidationError: If any spec is invalid
+        ServiceError: If the notebook's sources cannot be fetched
+    """
+    prepared = validate_artifact_specs(specs)
+
+    if any(not options.get("source_ids") for _, options in prepared):
+        all_ids = _resolve_source_ids(client, notebook_id, None)
+        for _, options in prepared:
+            if not options.get("source_ids"):
+                options["source_ids"] = all_ids
+
+    created: list[CreateResult | MindMapResult] = []
+    failed: dict[int, str] = {}
+    for index, (artifact_type, options) in enumerate(prepared):
+        try:
+            created.append(create_artifact(client, notebook_id, artifact_type, **options))
+        except ServiceError as e:
+            failed[index] = e.user_message
+    return BatchCreateResult(created=created, failed=failed)
+
+
 # ---------- Status ----------
 
 def get_studio_status(
@@ -386,18 +654,19 @@ def get_studio_status(
     Raises:
         ServiceError: If polling fails
     """
-    try:
-        artifacts = client.poll_studio_status(notebook_id)
-    except Exception as e:
-        raise ServiceError(
-            f"Failed to poll studio status: {e}",
-            user_message="Could not retrieve studio status.",
-        )
+    # Artifacts and mind maps are separate RPCs; fetch them side by side
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        mind_maps_future = pool.submit(client.list_mind_maps, notebook_id)
+        try:
+            artifacts = client.poll_studio_status(notebook_id)
+        except Exception as e:
+            raise ServiceError(
+                f"Failed to poll studio status: {e}",
+                user_message="Could not retrieve studio status.",
+            )
 
-    # Also fetch mind maps
     try:
-        mind_maps = client.list_mind_maps(notebook_id)
-        for mm in mind_maps:
+        for mm in mind_maps_future.result():
             artifacts.append({
                 "artifact_id": mm.get("mind_map_id"),
                 "type": "mind_map",
@@ -483,3 +752,37 @@ def delete_artifact(
             f"Failed to delete artifact: {e}",
             user_message="Could not delete artifact.",
         )
+
+
+def delete_artifacts(
+    client: "NotebookLMClient",
+    artifact_ids: list[str],
+    notebook_id: str,
+) -> BatchDeleteResult:
+    """Delete several studio artifacts concurrently.
+
+    Each delete is an independent RPC, so they are issued in parallel on
+    the client's shared connection pool. A failure for one ID does not
+    stop the others.
+
+    Returns:
+        BatchDeleteResult with deleted IDs (input order) and a map of
+        failed IDs to user-facing error messages
+    """
+    if not artifact_ids:
+        raise ValidationError("At least one artifact_id is required for delete")
+
+    def _delete_one(artifact_id: str) -> str | None:
+        try:
+            delete_artifact(client, artifact_id, notebook_id)
+        except ServiceError as e:
+            return e.user_message
+        return None
+
+    workers = min(MAX_PARALLEL_DELETES, len(artifact_ids))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        errors = list(pool.map(_delete_one, artifact_ids))
+
+    deleted = [aid for aid, err in zip(artifact_ids, errors, strict=True) if err is None]
+    failed = {aid: err for aid, err in zip(artifact_ids, errors, strict=True) if err is not None}
+    return BatchDeleteResult(deleted=deleted, failed=failed)
@@ -0,0 +1,49 @@
+"""JSON helpers that use orjson when it is installed.
+
+orjson is an optional speed-up (``pip install notebooklm-mcp-cli[fast]``).
+Without it everything falls back to the standard library ``json`` module.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document, preferring orjson.
+
+    orjson rejects NaN/Infinity literals, which the standard library
+    accepts, so those are retried with ``json.loads``. Invalid JSON raises
+    ``json.JSONDecodeError`` either way.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Serialize ``obj`` as indented JSON, preferring orjson.
+
+    Output matches ``json.dumps(obj, indent=2)`` so it does not change with
+    the backend. orjson always emits raw UTF-8, so documents with non-ASCII
+    text go through the standard library to keep them escaped, as do values
+    orjson cannot serialize (e.g. integers wider than 64 bits).
+    """
+    if orjson is not None:
+        try:
+            text = orjson.dumps(
+                obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:
+            pass
+        else:
+            if text.isascii():
+                return text
+    return json.dumps(obj, indent=2)
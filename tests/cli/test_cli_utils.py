@@ -0,0 +1,119 @@
+"""Tests for CLI utilities."""
+
+from unittest.mock import patch
+
+import pytest
+import typer
+
+from notebooklm_tools.cli.utils import code_choice, confirm_action, name_choice, parse_source_ids
+from notebooklm_tools.core import constants
+
+
+def test_confirm_action_skips_prompt_with_flag():
+    with patch("typer.confirm") as mock_confirm:
+        confirm_action("Delete?", confirm=True)
+    mock_confirm.assert_not_called()
+
+
+def test_confirm_action_prompts_on_tty():
+    with patch("sys.stdin.isatty", return_value=True), \
+            patch("typer.confirm") as mock_confirm:
+        confirm_action("Delete?")
+    mock_confirm.assert_called_once_with("Delete?", abort=True)
+
+
+def test_confirm_action_fails_fast_without_tty():
+    with patch("sys.stdin.isatty", return_value=False), \
+            patch("typer.confirm") as mock_confirm:
+        with pytest.raises(typer.Exit) as exc:
+            confirm_action("Delete?")
+    assert exc.value.exit_code == 2
+    mock_confirm.assert_not_called()
+
+
+def test_confirm_action_skips_prompt_with_env(monkeypatch):
+    monkeypatch.setenv("NLM_ASSUME_YES", "1")
+    with patch("sys.stdin.isatty", return_value=False), \
+            patch("typer.confirm") as mock_confirm:
+        confirm_action("Delete?")
+    mock_confirm.assert_not_called()
+
+
+def test_cli_error_boundary_converts_to_exit():
+    from notebooklm_tools.cli.utils import cli_error_boundary
+    from notebooklm_tools.core.exceptions import NLMError
+
+    @cli_error_boundary
+    def command(value: str) -> str:
+        if value == "bad":
+            raise NLMError("boom", hint="try again")
+        return value
+
+    assert command("ok") == "ok"
+    with pytest.raises(typer.Exit) as exc:
+        command("bad")
+    assert exc.value.exit_code == 1
+
+
+def test_cli_error_boundary_handles_service_errors():
+    from notebooklm_tools.cli.utils import cli_error_boundary
+    from notebooklm_tools.services.errors import ValidationError
+
+    @cli_error_boundary
+    def command() -> None:
+        raise ValidationError("bad input")
+
+    with pytest.raises(typer.Exit) as exc:
+        command()
+    assert exc.value.exit_code == 1
+
+
+def test_get_client_is_shared_and_survives_with_block(monkeypatch):
+    from notebooklm_tools.cli import utils
+
+    monkeypatch.setenv("NOTEBOOKLM_COOKIES", "SID=abc")
+    utils.reset_clients()
+    with patch("notebooklm_tools.cli.utils.NotebookLMClient") as mock_cls:
+        first = utils.get_client()
+        second = utils.get_client()
+    assert first is second
+    mock_cls.assert_called_once()
+    assert first.close_on_exit is False
+    utils.reset_clients()
+    first.close.assert_called_once()
+
+
+def test_parse_source_ids_splits_and_resolves():
+    with patch("notebooklm_tools.cli.utils.get_alias_manager") as mock_am:
+        mock_am.return_value.resolve_many.side_effect = list
+        assert parse_source_ids(" a, b ,,c,") == ["a", "b", "c"]
+
+
+def test_parse_source_ids_empty():
+    assert parse_source_ids(None) is None
+    assert parse_source_ids("") is None
+
+
+def test_code_choice_accepts_known_names():
+    check = code_choice(constants.AUDIO_FORMATS)
+    assert check("deep_dive") == "deep_dive"
+    assert check("Brief") == "Brief"
+    assert check(None) is None
+
+
+def test_code_choice_rejects_unknown_name():
+    check = code_choice(constants.AUDIO_FORMATS)
+    with pytest.raises(typer.BadParameter, match="brief, critique, debate, deep_dive"):
+        check("podcast")
+
+
+def test_name_choice_accepts_listed_names():
+    check = name_choice(("doc", "slides"))
+    assert check("slides") == "slides"
+    assert check(None) is None
+
+
+def test_name_choice_rejects_unlisted_name():
+    check = name_choice(("slides", "doc"))
+    with pytest.raises(typer.BadParameter, match="doc, slides"):
+        check("slide")
@@ -30,3 +30,12 @@ def test_detect_output_format_title_flag():
     with patch("sys.stdout.isatty", return_value=True):
         assert detect_output_format(title_flag=True) == OutputFormat.COMPACT
 
+
+def test_get_formatter_reuses_instance():
+    from rich.console import Console
+    from notebooklm_tools.cli.formatters import get_formatter, JsonFormatter
+    console = Console()
+    formatter = get_formatter(OutputFormat.JSON, console)
+    assert isinstance(formatter, JsonFormatter)
+    assert get_formatter(OutputFormat.JSON, console) is formatter
+    assert get_formatter(OutputFormat.TABLE, console) is not formatter
@@ -0,0 +1,60 @@
+"""Tests for research CLI helpers."""
+
+from notebooklm_tools.cli.commands.research import MAX_POLL_INTERVAL, _next_poll_interval
+
+
+def test_poll_interval_resets_on_change():
+    assert _next_poll_interval(45.0, 30, changed=True) == 30.0
+
+
+def test_poll_interval_backs_off_to_cap():
+    interval = 30.0
+    for _ in range(5):
+        interval = _next_poll_interval(interval, 30, changed=False)
+    assert interval == MAX_POLL_INTERVAL
+
+
+def test_poll_interval_respects_larger_base():
+    assert _next_poll_interval(120.0, 120, changed=False) == 120.0
+
+
+def _run_start(args, poll_status="completed"):
+    from unittest.mock import MagicMock, patch
+
+    from typer.testing import CliRunner
+
+    from notebooklm_tools.cli.commands import research
+
+    client = MagicMock()
+    client.__enter__.return_value = client
+    client.poll_research.return_value = None
+    with patch.object(research, "get_client", return_value=client), \
+            patch.object(research, "research_service") as service:
+        service.start_research.return_value = {"task_id": "task-1"}
+        service.poll_research.return_value = {"status": poll_status, "sources": []}
+        service.import_research.return_value = {"message": "Imported 3 sources"}
+        result = CliRunner().invoke(
+            research.app, ["start", "topic", "-n", "nb-1", "--max-wait", "0", *args],
+        )
+    return result, service
+
+
+def test_start_import_waits_then_imports():
+    result, service = _run_start(["--import"])
+    assert result.exit_code == 0, result.output
+    service.poll_research.assert_called_once()
+    service.import_research.assert_called_once()
+    assert service.import_research.call_args.args[1:] == ("nb-1", "task-1")
+    assert "Imported 3 sources" in result.output
+
+
+def test_start_import_skipped_when_not_finished():
+    result, service = _run_start(["--import"], poll_status="in_progress")
+    assert result.exit_code == 1
+    service.import_research.assert_not_called()
+
+
+def test_start_without_wait_does_not_poll():
+    result, service = _run_start([])
+    assert result.exit_code == 0, result.output
+    service.poll_research.assert_not_called()
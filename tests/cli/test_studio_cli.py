@@ -0,0 +1,44 @@
+"""Tests for studio CLI helpers."""
+
+import pytest
+
+from notebooklm_tools.cli.commands.studio import _validate_quiz_args
+from notebooklm_tools.services import ValidationError
+
+
+def test_validate_quiz_args_rejects_out_of_range():
+    _validate_quiz_args(5, 3)
+    with pytest.raises(ValidationError, match="--difficulty"):
+        _validate_quiz_args(5, 9)
+    with pytest.raises(ValidationError, match="--count"):
+        _validate_quiz_args(0, 2)
+
+
+def test_delete_rejects_empty_artifact_list():
+    from unittest.mock import patch
+
+    from typer.testing import CliRunner
+
+    from notebooklm_tools.cli.commands import studio
+
+    with patch.object(studio, "get_client") as get_client:
+        result = CliRunner().invoke(studio.app, ["delete", "nb-1", ",", "-y"])
+    assert result.exit_code == 1
+    assert "At least one artifact ID is required" in result.output
+    get_client.assert_not_called()
+
+
+def test_batch_create_rejects_bad_source_ids(tmp_path):
+    from unittest.mock import patch
+
+    from typer.testing import CliRunner
+
+    from notebooklm_tools.cli.commands import studio
+
+    spec_file = tmp_path / "specs.json"
+    spec_file.write_text('[{"type": "audio", "source_ids": 5}]')
+    with patch.object(studio, "get_client") as get_client:
+        result = CliRunner().invoke(studio.app, ["batch-create", "nb-1", str(spec_file), "-y"])
+    assert result.exit_code == 1
+    assert "source_ids must be a list" in result.output
+    get_client.assert_not_called()
@@ -0,0 +1,40 @@
+"""Tests for AliasManager."""
+
+from unittest.mock import patch
+
+import pytest
+
+from notebooklm_tools.core.alias import AliasManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    with patch("notebooklm_tools.core.alias.get_config_dir", return_value=tmp_path):
+        yield AliasManager()
+
+
+def test_resolve_passes_through_unknown(manager):
+    assert manager.resolve("abc-123") == "abc-123"
+
+
+def test_resolve_alias(manager):
+    manager.set_alias("research", "nb-uuid", "notebook")
+    assert manager.resolve("research") == "nb-uuid"
+
+
+def test_resolve_many_preserves_order(manager):
+    manager.set_alias("a", "src-a", "source")
+    manager.set_alias("b", "src-b", "source")
+    assert manager.resolve_many(["b", "raw-id", "a"]) == ["src-b", "raw-id", "src-a"]
+
+
+def test_resolve_many_accepts_generator(manager):
+    manager.set_alias("a", "src-a", "source")
+    assert manager.resolve_many(x for x in ("a", "z")) == ["src-a", "z"]
+
+
+def test_canonical_ids_skip_alias_table(manager):
+    uuid = "0f8fad5b-d9cb-469f-a165-70867728950e"
+    assert manager.resolve(uuid) == uuid
+    assert manager.resolve_many([uuid]) == [uuid]
+    assert manager._table is None
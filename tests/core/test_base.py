@@ -136,6 +136,106 @@ def test_close():
         assert client._client is None
 
 
+def test_get_client_created_once_across_threads():
+    """Concurrent first calls share one HTTP client."""
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from notebooklm_tools.core.base import BaseClient
+
+    client = BaseClient(cookies={}, csrf_token="token")
+    barrier = threading.Barrier(4)
+
+    def get(_):
+        barrier.wait()
+        return client._get_client()
+
+    with patch("notebooklm_tools.core.base.httpx.Client") as http_client:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            clients = list(pool.map(get, range(4)))
+
+    http_client.assert_called_once()
+    assert all(c is clients[0] for c in clients)
+
+
+def test_concurrent_auth_failures_recover_once():
+    """Requests failing auth together refresh tokens once and retire the old client."""
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    import httpx
+    from notebooklm_tools.core.base import BaseClient
+
+    barrier = threading.Barrier(4)
+    unauthorized = httpx.Response(401, request=httpx.Request("POST", "https://x"))
+
+    def failing_post(*args, **kwargs):
+        barrier.wait()
+        return unauthorized
+
+    old_client, new_client = MagicMock(), MagicMock()
+    old_client.post.side_effect = failing_post
+    new_client.post.return_value = MagicMock(text="ok")
+
+    client = BaseClient(cookies={}, csrf_token="token")
+    client._parse_response = lambda text: text
+    client._extract_rpc_result = lambda parsed, rpc_id: parsed
+    with patch.object(client, "_new_client", side_effect=[old_client, new_client]), \
+            patch.object(client, "_refresh_auth_tokens") as refresh:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: client._call_rpc("rpc", []), range(4)))
+
+    assert results == ["ok"] * 4
+    refresh.assert_called_once()
+    old_client.close.assert_not_called()
+    assert client._client is new_client
+
+    client.close()
+    old_client.close.assert_called_once()
+    new_client.close.assert_called_once()
+
+
+def test_reset_keeps_in_flight_client_open():
+    """A reset on one thread does not close a client another thread is using."""
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from notebooklm_tools.core.base import BaseClient
+
+    fetched, reset_done = threading.Event(), threading.Event()
+    old_client = MagicMock()
+
+    def post(*args, **kwargs):
+        if old_client.close.called:
+            raise RuntimeError("Cannot send a request, as the client has been closed.")
+        return MagicMock(text="ok")
+
+    old_client.post.side_effect = post
+
+    client = BaseClient(cookies={}, csrf_token="token")
+    client._parse_response = lambda text: text
+    client._extract_rpc_result = lambda parsed, rpc_id: parsed
+
+    def worker():
+        http = client._get_client()
+        fetched.set()
+        reset_done.wait()
+        return http.post("https://x").text
+
+    def resetter():
+        fetched.wait()
+        with client._lock:
+            client._reset_client()
+        reset_done.set()
+
+    with patch.object(client, "_new_client", return_value=old_client):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            result = pool.submit(worker)
+            pool.submit(resetter).result()
+            assert result.result() == "ok"
+
+    old_client.close.assert_not_called()
+    client.close()
+    old_client.close.assert_called_once()
+
+
 def test_constants_available():
     """Test that RPC and API constants are available on BaseClient."""
     from notebooklm_tools.core.base import BaseClient
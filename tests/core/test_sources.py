@@ -98,3 +98,34 @@ def test_get_source_guide_uses_call_rpc():
             
             mock_rpc.assert_called_once()
             assert result == {"summary": "", "keywords": []}
+
+
+def test_add_sources_batch_sends_one_request():
+    """Test that add_sources_batch packs every source into a single RPC."""
+    from notebooklm_tools.core.sources import SourceMixin
+
+    with patch.object(SourceMixin, '_get_client') as mock_get_client:
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        with patch.object(SourceMixin, '_parse_response'), \
+                patch.object(SourceMixin, '_build_request_body') as mock_body, \
+                patch.object(SourceMixin, '_extract_rpc_result') as mock_extract:
+            mock_extract.return_value = [[[["id1"], "Site"], [["id2"], "Video"], [["id3"], "Doc"]]]
+
+            mixin = SourceMixin(cookies={"test": "cookie"}, csrf_token="test")
+            result = mixin.add_sources_batch(
+                "nb-1",
+                urls=["https://example.com", "https://youtu.be/x"],
+                drive_documents=[("doc-1", "application/pdf", "Doc")],
+            )
+
+    assert mock_client.post.call_count == 1
+    source_data = mock_body.call_args[0][1][0]
+    assert source_data[0][2] == ["https://example.com"]
+    assert source_data[1][7] == ["https://youtu.be/x"]
+    assert source_data[2][0] == ["doc-1", "application/pdf", 1, "Doc"]
+    assert result == [
+        {"id": "id1", "title": "Site"},
+        {"id": "id2", "title": "Video"},
+        {"id": "id3", "title": "Doc"},
+    ]
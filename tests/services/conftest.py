@@ -0,0 +1,25 @@
+"""Shared fixtures for service tests."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from notebooklm_tools.core.client import NotebookLMClient
+
+
+@pytest.fixture
+def threaded_client():
+    """A real NotebookLMClient with a fake, slow-to-build HTTP client.
+
+    Building the HTTP client takes long enough that worker threads racing
+    to create it would each build one; ``threaded_client._new_client`` is
+    the mock that counts the builds.
+    """
+    def slow_new_client():
+        time.sleep(0.05)
+        return MagicMock()
+
+    client = NotebookLMClient(cookies={}, csrf_token="token")
+    with patch.object(client, "_new_client", side_effect=slow_new_client):
+        yield client
@@ -1,7 +1,7 @@
 """Tests for services.downloads module."""
 
 import pytest
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock, AsyncMock, patch
 
 from notebooklm_tools.services.downloads import (
     validate_artifact_type,
@@ -9,6 +9,7 @@ from notebooklm_tools.services.downloads import (
     get_default_extension,
     download_sync,
     download_async,
+    download_artifacts,
     VALID_ARTIFACT_TYPES,
     VALID_OUTPUT_FORMATS,
 )
@@ -190,3 +191,55 @@ class TestDownloadAsync:
             "nb-1", "/tmp/a.m4a", None,
             progress_callback=cb,
         )
+
+
+class TestDownloadArtifacts:
+    """Test download_artifacts function."""
+
+    def test_downloads_each_artifact_by_id(self, mock_client, tmp_path):
+        artifacts = [
+            {"artifact_id": "aaaaaaaa-1", "type": "audio"},
+            {"artifact_id": "bbbbbbbb-2", "type": "report"},
+            {"artifact_id": "cccccccc-3", "type": "quiz"},
+        ]
+        result = download_artifacts(mock_client, "nb-1", artifacts, str(tmp_path))
+        assert result["failed"] == {}
+        assert [d["artifact_type"] for d in result["downloaded"]] == ["audio", "report", "quiz"]
+        audio_args = mock_client.download_audio.call_args
+        assert audio_args.args[1] == str(tmp_path / "audio_aaaaaaaa.m4a")
+        assert audio_args.args[2] == "aaaaaaaa-1"
+        mock_client.download_report.assert_called_once_with(
+            "nb-1", str(tmp_path / "report_bbbbbbbb.md"), "bbbbbbbb-2",
+        )
+
+    def test_failure_does_not_stop_others(self, mock_client, tmp_path):
+        mock_client.download_video.side_effect = RuntimeError("boom")
+        artifacts = [
+            {"artifact_id": "v1", "type": "video"},
+            {"artifact_id": "d1", "type": "data_table"},
+        ]
+        result = download_artifacts(mock_client, "nb-1", artifacts, str(tmp_path))
+        assert [d["artifact_type"] for d in result["downloaded"]] == ["data_table"]
+        assert result["failed"] == {"v1": "Download failed for video."}
+
+    def test_invalid_type_raises_before_downloading(self, mock_client, tmp_path):
+        with pytest.raises(ValidationError):
+            download_artifacts(mock_client, "nb-1", [{"artifact_id": "x", "type": "podcast"}], str(tmp_path))
+        mock_client.download_audio.assert_not_called()
+
+    def test_empty_list(self, mock_client, tmp_path):
+        assert download_artifacts(mock_client, "nb-1", [], str(tmp_path)) == {"downloaded": [], "failed": {}}
+
+    def test_workers_share_one_http_client(self, threaded_client, tmp_path):
+        report_type = threaded_client.STUDIO_TYPE_REPORT
+        rows = [[f"r{i}", "Report", report_type, None, 3, None, None, [f"# R{i}"]] for i in range(4)]
+        with patch.object(threaded_client, "_parse_response"), \
+                patch.object(threaded_client, "_extract_rpc_result", return_value=[rows]):
+            result = download_artifacts(
+                threaded_client, "nb-1",
+                [{"artifact_id": f"r{i}", "type": "report"} for i in range(4)],
+                str(tmp_path),
+            )
+        assert result["failed"] == {}
+        assert (tmp_path / "report_r3.md").read_text() == "# R3"
+        threaded_client._new_client.assert_called_once()
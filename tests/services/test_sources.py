@@ -1,12 +1,14 @@
 """Tests for services.sources module."""
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from notebooklm_tools.services.sources import (
     validate_source_type,
     resolve_drive_mime_type,
     add_source,
+    add_sources_batch,
+    check_sources_freshness,
     list_drive_sources,
     sync_drive_sources,
     delete_source,
@@ -146,6 +148,64 @@ class TestAddSource:
         )
 
 
+class TestAddSourcesBatch:
+    """Test add_sources_batch function."""
+
+    def test_single_client_call(self, mock_client):
+        mock_client.add_sources_batch.return_value = [
+            {"id": "s1", "title": "A"}, {"id": "s2", "title": "B"},
+        ]
+        result = add_sources_batch(
+            mock_client, "nb-1", urls=["https://a.com"], document_ids=["d1"], doc_type="pdf",
+        )
+        mock_client.add_sources_batch.assert_called_once_with(
+            "nb-1", urls=["https://a.com"],
+            drive_documents=[("d1", "application/pdf", "Drive Document")],
+        )
+        assert [r["source_type"] for r in result] == ["url", "drive"]
+        assert [r["source_id"] for r in result] == ["s1", "s2"]
+
+    def test_partial_result_types_unknown(self, mock_client):
+        mock_client.add_sources_batch.return_value = [{"id": "s1", "title": "A"}]
+        result = add_sources_batch(mock_client, "nb-1", urls=["https://a.com", "https://b.com"])
+        assert result == [{"source_type": "unknown", "source_id": "s1", "title": "A"}]
+
+    def test_empty_raises(self, mock_client):
+        with pytest.raises(ValidationError, match="At least one"):
+            add_sources_batch(mock_client, "nb-1")
+
+    def test_no_ids_returned_raises(self, mock_client):
+        mock_client.add_sources_batch.return_value = []
+        with pytest.raises(ServiceError, match="no IDs returned"):
+            add_sources_batch(mock_client, "nb-1", urls=["https://a.com"])
+
+    def test_api_error_wraps_in_service_error(self, mock_client):
+        mock_client.add_sources_batch.side_effect = RuntimeError("boom")
+        with pytest.raises(ServiceError, match="Failed to add 1 sources"):
+            add_sources_batch(mock_client, "nb-1", urls=["https://a.com"])
+
+
+class TestCheckSourcesFreshness:
+    """Test check_sources_freshness function."""
+
+    def test_maps_each_source(self, mock_client):
+        mock_client.check_source_freshness.side_effect = lambda sid: sid == "a"
+        assert check_sources_freshness(mock_client, ["a", "b", "c"]) == {
+            "a": True, "b": False, "c": False,
+        }
+
+    def test_empty(self, mock_client):
+        assert check_sources_freshness(mock_client, []) == {}
+        mock_client.check_source_freshness.assert_not_called()
+
+    def test_workers_share_one_http_client(self, threaded_client):
+        with patch.object(threaded_client, "_parse_response"), \
+                patch.object(threaded_client, "_extract_rpc_result", return_value=[[None, True]]):
+            result = check_sources_freshness(threaded_client, ["s1", "s2", "s3", "s4"])
+        assert result == {"s1": True, "s2": True, "s3": True, "s4": True}
+        threaded_client._new_client.assert_called_once()
+
+
 class TestListDriveSources:
     """Test list_drive_sources function."""
 
@@ -181,7 +241,12 @@ class TestSyncDriveSources:
         assert all(r["synced"] for r in results)
 
     def test_sync_partial_failure(self, mock_client):
-        mock_client.sync_drive_source.side_effect = [True, RuntimeError("fail")]
+        def sync(source_id):
+            if source_id == "s2":
+                raise RuntimeError("fail")
+            return True
+
+        mock_client.sync_drive_source.side_effect = sync
         results = sync_drive_sources(mock_client, ["s1", "s2"])
         assert results[0]["synced"] is True
         assert results[1]["synced"] is False
@@ -191,6 +256,13 @@ class TestSyncDriveSources:
         with pytest.raises(ValidationError, match="No source IDs"):
             sync_drive_sources(mock_client, [])
 
+    def test_workers_share_one_http_client(self, threaded_client):
+        with patch.object(threaded_client, "_parse_response"), \
+                patch.object(threaded_client, "_extract_rpc_result", return_value=[[["s1"], "Doc", []]]):
+            results = sync_drive_sources(threaded_client, ["s1", "s2", "s3", "s4"])
+        assert all(r["synced"] for r in results)
+        threaded_client._new_client.assert_called_once()
+
 
 class TestDeleteSource:
     """Test delete_source function."""
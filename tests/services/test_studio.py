@@ -1,6 +1,7 @@
 """Tests for services.studio module."""
 
 import json
+import threading
 
 import pytest
 from unittest.mock import MagicMock, patch
@@ -8,15 +9,27 @@ from unittest.mock import MagicMock, patch
 from notebooklm_tools.services.studio import (
     validate_artifact_type,
     resolve_code,
+    validate_create_args,
     create_artifact,
+    create_artifacts,
+    validate_artifact_specs,
     get_studio_status,
     rename_artifact,
     delete_artifact,
+    delete_artifacts,
     VALID_ARTIFACT_TYPES,
 )
+from notebooklm_tools.services import studio as studio_module
 from notebooklm_tools.services.errors import ValidationError, ServiceError
 
 
+@pytest.fixture(autouse=True)
+def clear_rejections():
+    studio_module._recent_rejections.clear()
+    yield
+    studio_module._recent_rejections.clear()
+
+
 @pytest.fixture
 def mock_client():
     client = MagicMock()
@@ -85,6 +98,23 @@ class TestResolveCode:
             resolve_code(mapper, "bad", "audio format")
 
 
+class TestValidateCreateArgs:
+    """Test validate_create_args function."""
+
+    def test_resolves_present_codes(self):
+        codes = validate_create_args("audio", audio_format="brief", focus_prompt="x")
+        assert set(codes) == {"audio_format"}
+
+    def test_unknown_option_raises(self):
+        with pytest.raises(ValidationError, match="Unknown video format"):
+            validate_create_args("video", video_format="nope")
+
+    def test_bad_option_fails_before_network(self, mock_client):
+        with pytest.raises(ValidationError):
+            create_artifact(mock_client, "nb-1", "audio", audio_format="nope")
+        mock_client.get_notebook_sources_with_types.assert_not_called()
+
+
 class TestCreateArtifact:
     """Test create_artifact function."""
 
@@ -162,9 +192,43 @@ class TestCreateArtifact:
             create_artifact(mock_client, "nb-1", "report")
 
     def test_no_artifact_id_raises(self, mock_client):
+        mock_client.create_report.return_value = {}
+        with pytest.raises(ServiceError, match="rejected") as exc:
+            create_artifact(mock_client, "nb-1", "report")
+        assert exc.value.hint == studio_module.REJECTION_HINT
+
+    def test_recent_rejection_short_circuits(self, mock_client):
+        mock_client.create_report.return_value = {}
+        with pytest.raises(ServiceError, match="rejected"):
+            create_artifact(mock_client, "nb-1", "report")
+        mock_client.reset_mock()
+        with pytest.raises(ServiceError, match="rejected .* ago"):
+            create_artifact(mock_client, "nb-1", "report")
+        mock_client.create_report.assert_not_called()
+        # Other notebooks and artifact types are unaffected
+        assert create_artifact(mock_client, "nb-1", "audio")["artifact_id"] == "art-1"
+
+    def test_retry_with_different_options_not_held_back(self, mock_client):
+        mock_client.create_report.return_value = {}
+        with pytest.raises(ServiceError, match="rejected"):
+            create_artifact(mock_client, "nb-1", "report", source_ids=["s1", "s2"])
+        mock_client.create_report.return_value = {"artifact_id": "art-5"}
+        result = create_artifact(mock_client, "nb-1", "report", source_ids=["s1"])
+        assert result["artifact_id"] == "art-5"
+        result = create_artifact(
+            mock_client, "nb-1", "report", source_ids=["s1", "s2"], custom_prompt="Shorter",
+        )
+        assert result["artifact_id"] == "art-5"
+
+    def test_rejection_expires_after_cooldown(self, mock_client):
         mock_client.create_report.return_value = {}
         with pytest.raises(ServiceError, match="rejected"):
             create_artifact(mock_client, "nb-1", "report")
+        for key in studio_module._recent_rejections:
+            studio_module._recent_rejections[key] -= studio_module.REJECTION_COOLDOWN_SECONDS
+        mock_client.create_report.return_value = {"artifact_id": "art-5"}
+        assert create_artifact(mock_client, "nb-1", "report")["artifact_id"] == "art-5"
+        assert studio_module._recent_rejections == {}
 
     def test_api_error_wraps(self, mock_client):
         mock_client.create_report.side_effect = RuntimeError("boom")
@@ -201,6 +265,30 @@ class TestGetStudioStatus:
         with pytest.raises(ServiceError, match="Failed to poll"):
             get_studio_status(mock_client, "nb-1")
 
+    def test_fetches_run_concurrently(self, mock_client):
+        # Each call waits for the other; run sequentially this would time out
+        barrier = threading.Barrier(2, timeout=5)
+
+        def rendezvous(mock):
+            value = mock.return_value
+
+            def wait(notebook_id):
+                barrier.wait()
+                return value
+            return wait
+
+        mock_client.poll_studio_status.side_effect = rendezvous(mock_client.poll_studio_status)
+        mock_client.list_mind_maps.side_effect = rendezvous(mock_client.list_mind_maps)
+        result = get_studio_status(mock_client, "nb-1")
+        assert result["total"] == 3
+
+    def test_fetches_share_one_http_client(self, threaded_client):
+        with patch.object(threaded_client, "_parse_response"), \
+                patch.object(threaded_client, "_extract_rpc_result", return_value=[]):
+            result = get_studio_status(threaded_client, "nb-1")
+        assert result["total"] == 0
+        threaded_client._new_client.assert_called_once()
+
 
 class TestRenameArtifact:
     """Test rename_artifact function."""
@@ -245,3 +333,80 @@ class TestDeleteArtifact:
         mock_client.delete_studio_artifact.side_effect = RuntimeError("fail")
         with pytest.raises(ServiceError, match="Failed to delete"):
             delete_artifact(mock_client, "art-1", "nb-1")
+
+
+class TestCreateArtifacts:
+    """Test create_artifacts function."""
+
+    def test_creates_all_and_fetches_sources_once(self, mock_client):
+        result = create_artifacts(
+            mock_client, "nb-1", [{"type": "audio"}, {"type": "report"}],
+        )
+        assert [r["artifact_id"] for r in result["created"]] == ["art-1", "art-5"]
+        assert result["failed"] == {}
+        mock_client.get_notebook_sources_with_types.assert_called_once_with("nb-1")
+
+    def test_invalid_spec_fails_before_network(self, mock_client):
+        with pytest.raises(ValidationError, match="Spec #2: unknown option"):
+            create_artifacts(
+                mock_client, "nb-1", [{"type": "audio"}, {"type": "report", "bogus": 1}],
+            )
+        mock_client.get_notebook_sources_with_types.assert_not_called()
+
+    def test_rejection_reported_per_spec(self, mock_client):
+        mock_client.create_report.return_value = {}
+        result = create_artifacts(
+            mock_client, "nb-1", [{"type": "report"}, {"type": "quiz"}],
+        )
+        assert [r["artifact_type"] for r in result["created"]] == ["quiz"]
+        assert "rejected" in result["failed"][0]
+
+    def test_missing_type_raises(self):
+        with pytest.raises(ValidationError, match="'type'"):
+            validate_artifact_specs([{"audio_format": "brief"}])
+
+    def test_wrong_source_ids_type_raises(self):
+        with pytest.raises(ValidationError, match="Spec #1: source_ids must be a list"):
+            validate_artifact_specs([{"type": "audio", "source_ids": 5}])
+
+    def test_wrong_option_type_raises(self):
+        with pytest.raises(ValidationError, match="Spec #1: question_count must be an integer"):
+            validate_artifact_specs([{"type": "quiz", "question_count": "five"}])
+
+    def test_create_options_match_create_artifact(self):
+        import inspect
+
+        params = inspect.signature(studio_module.create_artifact).parameters
+        keyword = {
+            name: param.annotation
+            for name, param in params.items()
+            if param.kind is inspect.Parameter.KEYWORD_ONLY and name != "source_ids"
+        }
+        assert keyword == {
+            name: kind.__name__ for name, kind in studio_module._CREATE_OPTIONS.items()
+        }
+
+    def test_comma_separated_source_ids_split(self):
+        [(_, options)] = validate_artifact_specs(
+            [{"type": "audio", "source_ids": "src-1, src-2"}],
+        )
+        assert options["source_ids"] == ["src-1", "src-2"]
+
+
+class TestDeleteArtifacts:
+    """Test delete_artifacts function."""
+
+    def test_deletes_all(self, mock_client):
+        result = delete_artifacts(mock_client, ["art-1", "art-2", "art-3"], "nb-1")
+        assert result == {"deleted": ["art-1", "art-2", "art-3"], "failed": {}}
+        assert mock_client.delete_studio_artifact.call_count == 3
+
+    def test_partial_failure(self, mock_client):
+        mock_client.delete_studio_artifact.side_effect = lambda aid, notebook_id: aid != "art-2"
+        result = delete_artifacts(mock_client, ["art-1", "art-2", "art-3"], "nb-1")
+        assert result["deleted"] == ["art-1", "art-3"]
+        assert result["failed"] == {"art-2": "Failed to delete artifact."}
+
+    def test_empty_list(self, mock_client):
+        with pytest.raises(ValidationError):
+            delete_artifacts(mock_client, [], "nb-1")
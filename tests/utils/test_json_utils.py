@@ -0,0 +1,54 @@
+"""Tests for utils.json_utils module."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from notebooklm_tools.utils import json_utils
+
+
+def test_loads_parses_document():
+    assert json_utils.loads('[1, "a", {"b": null}]') == [1, "a", {"b": None}]
+
+
+def test_loads_accepts_bytes():
+    assert json_utils.loads(b'{"a": 1}') == {"a": 1}
+
+
+def test_loads_accepts_nan_literals():
+    # orjson rejects NaN, the stdlib fallback accepts it
+    result = json_utils.loads("[NaN]")
+    assert result[0] != result[0]
+
+
+def test_loads_invalid_raises_stdlib_error():
+    with pytest.raises(json.JSONDecodeError):
+        json_utils.loads("not json")
+
+
+def test_loads_without_orjson():
+    with patch.object(json_utils, "orjson", None):
+        assert json_utils.loads('{"a": [1, 2]}') == {"a": [1, 2]}
+
+
+def test_dumps_matches_stdlib_indent():
+    data = [{"id": "abc", "title": "Report", "count": 2, "stale": False, "x": None}]
+    assert json_utils.dumps(data) == json.dumps(data, indent=2)
+
+
+def test_dumps_escapes_non_ascii():
+    data = [{"id": "abc", "title": "Résumé 日本"}]
+    result = json_utils.dumps(data)
+    assert result == json.dumps(data, indent=2)
+    assert "R\\u00e9sum\\u00e9" in result
+
+
+def test_dumps_without_orjson():
+    data = {"title": "Résumé", "items": [1, 2]}
+    with patch.object(json_utils, "orjson", None):
+        assert json_utils.dumps(data) == json.dumps(data, indent=2)
+
+
+def test_dumps_falls_back_for_big_ints():
+    assert json_utils.loads(json_utils.dumps({"n": 2**70})) == {"n": 2**70}